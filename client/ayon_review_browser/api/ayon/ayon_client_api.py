@@ -1,5 +1,7 @@
-from typing import Optional, List, Dict, Any
+import threading
+from typing import Callable, Optional, Iterator, List, Dict, Any, Tuple
 
+from .base_client import BaseAyonClient
 from .project_service import ProjectService
 from .version_service import VersionService
 from .task_service import TaskService
@@ -20,6 +22,12 @@ class AyonClient:
     def get_lists(self, project_name: str, entity_type: Optional[str] = "version") -> Dict[str, str]:
         return self.project_service.get_lists(project_name, entity_type)
 
+    def get_addon_settings(self, project_name: Optional[str] = None) -> Dict[str, Any]:
+        return self.project_service.get_addon_settings(project_name)
+
+    def get_change_stamp(self, project_name: str, updated_since: str) -> Tuple[int, str, int, str]:
+        return self.project_service.get_change_stamp(project_name, updated_since)
+
     def get_list_items(self, project_name: str, list_id: str) -> List[Dict[str, Any]]:
         return self.project_service.get_list_items(project_name, list_id)
 
@@ -27,11 +35,13 @@ class AyonClient:
         return self.project_service.get_list_versions(project_name, list_id)
 
     # Version operations
-    def get_version_thumbnail_to_local(self, project_name: str, version_id: str) -> Optional[str]:
-        return self.version_service.get_version_thumbnail_to_local(project_name, version_id)
+    def get_version_thumbnail_to_local(self, project_name: str, version_id: str,
+                                       thumbnail_id: Optional[str] = None) -> Optional[str]:
+        return self.version_service.get_version_thumbnail_to_local(project_name, version_id, thumbnail_id)
 
-    def get_version_thumbnail_data(self, project_name: str, version_id: str) -> Optional[bytes]:
-        return self.version_service.get_version_thumbnail_data(project_name, version_id)
+    def get_version_thumbnail_data(self, project_name: str, version_id: str,
+                                   thumbnail_id: Optional[str] = None) -> Optional[bytes]:
+        return self.version_service.get_version_thumbnail_data(project_name, version_id, thumbnail_id)
 
     def get_versions_for_product(self, project_name: str, product_id: str) -> List[Dict[str, Any]]:
         return self.version_service.get_versions_for_product(project_name, product_id)
@@ -39,17 +49,47 @@ class AyonClient:
     def get_version_details(self, project_name: str, version_id: str) -> Dict[str, Any]:
         return self.version_service.get_version_details(project_name, version_id)
 
+    def get_versions_details(self, project_name: str, version_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        return self.version_service.get_versions_details(project_name, version_ids)
+
+    def get_product_versions(self, project_name: str, product_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        return self.version_service.get_product_versions(project_name, product_ids)
+
+    def get_versions_representations(self, project_name: str,
+                                     version_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        return self.version_service.get_versions_representations(project_name, version_ids)
+
+    def get_versions_reviewables(self, project_name: str, version_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        return self.version_service.get_versions_reviewables(project_name, version_ids)
+
+    def get_updated_version_ids(self, project_name: str, updated_since: str) -> List[str]:
+        return self.version_service.get_updated_version_ids(project_name, updated_since)
+
     # Task operations
     def get_tasks(self, project_name: str) -> Dict[str, Any]:
         return self.task_service.get_tasks(project_name)
 
+    def iter_task_pages(self, project_name: str) -> Iterator[List[Dict[str, Any]]]:
+        return self.task_service.iter_task_pages(project_name)
+
+    def iter_submission_task_pages(self, project_name: str,
+                                   updated_since: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        return self.task_service.iter_submission_task_pages(project_name, updated_since=updated_since)
+
     def get_recent_tasks_count(self, project_name: str, days: int = 7) -> int:
         return self.task_service.get_recent_tasks_count(project_name, days)
 
     # File operations
     @staticmethod
-    def upload_file(project_name: str, file_path: str, activity_id: str = None) -> Optional[str]:
-        return FileService.upload_file(project_name, file_path, activity_id)
+    def upload_file(project_name: str, file_path: str, activity_id: str = None,
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> Optional[str]:
+        return FileService.upload_file(project_name, file_path, activity_id, progress_callback)
+
+    @staticmethod
+    def download_file(project_name: str, file_id: str, filename: str = None,
+                      progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+                      cancel_event: Optional[threading.Event] = None) -> Optional[str]:
+        return FileService.download_file(project_name, file_id, filename, progress_callback, cancel_event)
 
     # Status operations
     def get_version_statuses(self, project_name: str) -> List[Dict[str, str]]:
@@ -69,21 +109,22 @@ class AyonClient:
         }
         """
         variables = {"projectName": project_name}
-        result = self.graphql_query(query, variables)
+        result = BaseAyonClient.graphql_read_query(query, variables)
 
         if result and "data" in result and result["data"]["project"]:
-            statuses = result["data"]["project"]["statuses"]
-
-            version_statuses = [
-                {"value": status["name"], "color": status["color"]}
-                for status in statuses
-                if "version" in status["scope"]
-            ]
-
-            return [{"value": "All"}] + version_statuses
+            return self._format_version_statuses(result["data"]["project"]["statuses"])
 
         return [{"value": "All"}]
 
+    @staticmethod
+    def _format_version_statuses(statuses: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        version_statuses = [
+            {"value": status["name"], "color": status["color"]}
+            for status in statuses
+            if "version" in status["scope"]
+        ]
+        return [{"value": "All"}] + version_statuses
+
     # Task type operations
     def get_task_types(self, project_name: str) -> List[Dict[str, str]]:
         """Get available task types for a project with colors and icons."""
@@ -100,19 +141,73 @@ class AyonClient:
         }
         """
         variables = {"projectName": project_name}
-        result = self.graphql_query(query, variables)
+        result = BaseAyonClient.graphql_read_query(query, variables)
 
         if result and "data" in result and result["data"]["project"]:
-            task_types = result["data"]["project"]["taskTypes"]
+            return self._format_task_types(result["data"]["project"]["taskTypes"])
 
-            task_type_items = [
-                {"value": task_type["name"], "color": task_type["color"]}
-                for task_type in task_types
-            ]
+        return [{"value": "All"}]
+
+    @staticmethod
+    def _format_task_types(task_types: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        task_type_items = [
+            {"value": task_type["name"], "color": task_type["color"]}
+            for task_type in task_types
+        ]
+        return [{"value": "All"}] + task_type_items
+
+    # Project metadata operations
+    def get_project_metadata(self, project_name: str, entity_type: Optional[str] = "version") -> Dict[str, Any]:
+        """Get version statuses, task types and entity lists in a single query."""
+        query = """
+        query GetProjectMetadata($projectName: String!) {
+            project(name: $projectName) {
+                statuses {
+                    name
+                    color
+                    icon
+                    shortName
+                    state
+                    scope
+                }
+                taskTypes {
+                    icon
+                    name
+                    shortName
+                    color
+                }
+                entityLists {
+                    edges {
+                        node {
+                            id
+                            active
+                            label
+                            entityType
+                        }
+                    }
+                }
+            }
+        }
+        """
+        metadata = {
+            "statuses": [{"value": "All"}],
+            "task_types": [{"value": "All"}],
+            "lists": {}
+        }
+        try:
+            result = BaseAyonClient.graphql_read_query(query, {"projectName": project_name})
+        except Exception as e:
+            print(f"Failed to fetch metadata for '{project_name}': {e}")
+            return metadata
 
-            return [{"value": "All"}] + task_type_items
+        project = ((result or {}).get("data") or {}).get("project")
+        if not project:
+            return metadata
 
-        return [{"value": "All"}]
+        metadata["statuses"] = self._format_version_statuses(project.get("statuses") or [])
+        metadata["task_types"] = self._format_task_types(project.get("taskTypes") or [])
+        metadata["lists"] = ProjectService.format_lists(project.get("entityLists") or {}, entity_type)
+        return metadata
 
     # Version status update
     def update_version_status(self, project_name: str, version_id: str, status: str) -> bool:
@@ -122,5 +217,5 @@ class AyonClient:
     # GraphQL operations
     @staticmethod
     def graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
-        from .base_client import BaseAyonClient
+        """Run any query or mutation; not retried, so a mutation is never applied twice."""
         return BaseAyonClient.graphql_query(query, variables)
@@ -1,10 +1,49 @@
+import json
 import os
+import threading
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ayon_api import get_server_api_connection
 
+# Connection pool size per host, enough for the thumbnail and data workers
+HTTP_POOL_SIZE = 16
+# Read-only GraphQL queries are retried on connection errors and gateway failures
+GRAPHQL_RETRY_TOTAL = 3
+GRAPHQL_RETRY_BACKOFF = 0.5
+
+
+def _create_graphql_retry() -> Retry:
+    retry_kwargs = dict(
+        total=GRAPHQL_RETRY_TOTAL,
+        backoff_factor=GRAPHQL_RETRY_BACKOFF,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    try:
+        return Retry(allowed_methods=frozenset({"POST"}), **retry_kwargs)
+    except TypeError:
+        # urllib3 < 1.26
+        return Retry(method_whitelist=frozenset({"POST"}), **retry_kwargs)
+
+
+def build_updated_since_filter(updated_since: Optional[str],
+                               conditions: Optional[List[Dict[str, Any]]] = None) -> Optional[str]:
+    """Build a query filter JSON of `conditions` plus an `updatedAt >= updated_since` condition."""
+    conditions = list(conditions or [])
+    if updated_since:
+        conditions.append({"key": "updatedAt", "operator": "gte", "value": updated_since})
+    if not conditions:
+        return None
+    return json.dumps({"conditions": conditions})
+
 
 class BaseAyonClient:
+    _sessions = {}  # retry_queries -> session
+    _session_key = None
+    _session_lock = threading.Lock()
+
     def __init__(self) -> None:
 
         try:
@@ -21,24 +60,68 @@ class BaseAyonClient:
             return result["data"]
         return {}
 
+    @classmethod
+    def get_session(cls, retry_queries: bool = False) -> Tuple[requests.Session, str]:
+        """Return shared keep-alive HTTP session and the AYON server url.
+
+        The session carries the authorization headers and is rebuilt only
+        when AYON_SERVER_URL or AYON_API_KEY change. With `retry_queries`
+        a separate session is returned whose GraphQL requests are retried,
+        only meant for read-only queries.
+        """
+        server_url = os.environ.get("AYON_SERVER_URL", "").rstrip("/")
+        api_key = os.environ.get("AYON_API_KEY", "")
+        if not server_url or not api_key:
+            raise Exception("Missing AYON_SERVER_URL or AYON_API_KEY environment variables")
+
+        session_key = (server_url, api_key)
+        with cls._session_lock:
+            if cls._session_key != session_key:
+                for session in cls._sessions.values():
+                    session.close()
+                cls._sessions = {}
+                cls._session_key = session_key
+            session = cls._sessions.get(retry_queries)
+            if session is None:
+                session = cls._create_session(server_url, api_key, retry_queries)
+                cls._sessions[retry_queries] = session
+            return session, server_url
+
+    @staticmethod
+    def _create_session(server_url: str, api_key: str, retry_queries: bool = False) -> requests.Session:
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Accept-Encoding": "gzip, deflate",
+        })
+
+        # Uploads, downloads and mutations are not retried blindly, only read-only GraphQL queries
+        session.mount(server_url, HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE))
+        if retry_queries:
+            session.mount(
+                f"{server_url}/graphql",
+                HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE, max_retries=_create_graphql_retry())
+            )
+        return session
+
     @staticmethod
     def graphql_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
-        try:
-            url = os.environ.get("AYON_SERVER_URL", "").rstrip("/") + "/graphql"
-            api_key = os.environ.get("AYON_API_KEY", "")
+        """Run a GraphQL query or mutation, sent once."""
+        return BaseAyonClient._post_graphql(query, variables, False)
 
-            if not url or not api_key:
-                raise Exception("Missing AYON_SERVER_URL or AYON_API_KEY environment variables")
+    @staticmethod
+    def graphql_read_query(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a read-only GraphQL query, retried on connection errors and gateway failures."""
+        return BaseAyonClient._post_graphql(query, variables, True)
 
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {api_key}"
-            }
+    @staticmethod
+    def _post_graphql(query: str, variables: Dict[str, Any], retry_queries: bool) -> Dict[str, Any]:
+        try:
+            session, server_url = BaseAyonClient.get_session(retry_queries)
 
-            response = requests.post(
-                url,
+            response = session.post(
+                f"{server_url}/graphql",
                 json={"query": query, "variables": variables},
-                headers=headers,
                 timeout=30
             )
             response.raise_for_status()
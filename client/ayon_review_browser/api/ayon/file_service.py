@@ -1,15 +1,84 @@
 import os
+import re
+import threading
 
 import requests
-import tempfile
-from typing import Optional
+from typing import Callable, Optional
 from pathlib import Path
 import ayon_api
 
+from .base_client import BaseAyonClient
+
+try:
+    from ...constants import CACHE_ROOT_DIR, MEDIA_CACHE_MAX_BYTES
+    from ...utils.disk_cache import DiskCache
+except ImportError:
+    from constants import CACHE_ROOT_DIR, MEDIA_CACHE_MAX_BYTES
+    from utils.disk_cache import DiskCache
+
+# Bytes written to disk per chunk while streaming a download
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Interrupted downloads are resumed with a Range request this many times
+DOWNLOAD_RETRIES = 3
+# (connect, read) timeouts of download requests; the read timeout is per chunk
+DOWNLOAD_TIMEOUT = (10, 60)
+
+# Uploads get a read timeout of at least this many seconds, more for big files
+UPLOAD_MIN_TIMEOUT = 30
+# Slowest upload rate a read timeout is sized for, in bytes per second
+UPLOAD_MIN_BYTES_PER_SECOND = 256 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+_CONTENT_RANGE_TOTAL = re.compile(r"bytes\s+\d+-\d+/(\d+)")
+_UNSATISFIED_RANGE_TOTAL = re.compile(r"bytes\s+\*/(\d+)")
+
+
+class _UploadReader:
+    """File wrapper streamed by requests in chunks, reporting bytes sent.
+
+    Its length lets requests send a Content-Length header instead of a
+    chunked body.
+    """
+
+    def __init__(self, file_obj, size: int, progress_callback=None):
+        self._file = file_obj
+        self._size = size
+        self._sent = 0
+        self._progress_callback = progress_callback
+
+    def __len__(self) -> int:
+        return self._size
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = UPLOAD_CHUNK_SIZE
+        chunk = self._file.read(min(size, UPLOAD_CHUNK_SIZE))
+        if chunk:
+            self._sent += len(chunk)
+            if self._progress_callback:
+                self._progress_callback(self._sent, self._size)
+        return chunk
+
 
 class FileService:
+    _media_cache = None
+
+    @classmethod
+    def get_media_cache(cls) -> DiskCache:
+        """Return the cache of downloaded files, shared by all sessions on this machine."""
+        if cls._media_cache is None:
+            cls._media_cache = DiskCache(os.path.join(CACHE_ROOT_DIR, "media"), MEDIA_CACHE_MAX_BYTES)
+        return cls._media_cache
+
     @staticmethod
-    def upload_file(project_name: str, file_path: str, activity_id: str = None) -> Optional[str]:
+    def upload_file(project_name: str, file_path: str, activity_id: str = None,
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> Optional[str]:
+        """Upload a file and return its id on the server.
+
+        The file is streamed from disk instead of read into memory, the
+        read timeout grows with the file size and
+        `progress_callback(sent_bytes, total_bytes)` is called per chunk.
+        """
         import mimetypes
 
         try:
@@ -25,20 +94,22 @@ class FileService:
 
         headers = {
             "Content-Type": mime_type or "application/octet-stream",
-            "X-File-Name": file_name,
-            "Authorization": f"Bearer {os.environ['AYON_API_KEY']}"
+            "X-File-Name": file_name
         }
 
         if activity_id:
             headers["X-Activity-Id"] = activity_id
 
         try:
+            session, server_url = BaseAyonClient.get_session()
+            file_size = os.path.getsize(safe_path)
+            read_timeout = max(UPLOAD_MIN_TIMEOUT, file_size / UPLOAD_MIN_BYTES_PER_SECOND)
             with open(safe_path, 'rb') as f:
-                response = requests.post(
-                    f"{os.environ['AYON_SERVER_URL']}/api/projects/{project_name}/files",
-                    data=f.read(),
+                response = session.post(
+                    f"{server_url}/api/projects/{project_name}/files",
+                    data=_UploadReader(f, file_size, progress_callback),
                     headers=headers,
-                    timeout=30
+                    timeout=(10, read_timeout)
                 )
         except (FileNotFoundError, PermissionError, requests.RequestException) as e:
             print(f"Error uploading file: {e}")
@@ -49,27 +120,109 @@ class FileService:
         return None
 
     @staticmethod
-    def download_file(project_name: str, file_id: str, filename: str = None) -> Optional[str]:
-        """Download file and return temporary path."""
-        try:
-            ayon_con = ayon_api.get_server_api_connection()
-            endpoint = f"/projects/{project_name}/files/{file_id}"
-            response = ayon_con.get(endpoint)
-
-            if response.status_code != 200:
-                print(f"Download failed ({response.status_code}): {response.text}")
-                return None
-
-            if not filename:
-                filename = file_id
-
-            with tempfile.NamedTemporaryFile(mode='wb', suffix=f"_{filename}", delete=False) as temp_file:
-                temp_file.write(response.content)
-                return temp_file.name
+    def download_file(project_name: str, file_id: str, filename: str = None,
+                      progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+                      cancel_event: Optional[threading.Event] = None) -> Optional[str]:
+        """Download file into the local media cache and return its path.
+
+        Files already cached are returned right away. Otherwise the file is
+        streamed to disk in chunks, interrupted transfers are resumed with
+        HTTP Range requests and the final size is verified before the file
+        is moved into the cache. `progress_callback(downloaded_bytes,
+        total_bytes)` is called after every chunk; total is None when the
+        server doesn't report it. Once `cancel_event` is set the transfer
+        stops, None is returned and the partial file is kept for resuming.
+        """
+        if not filename:
+            filename = file_id
+
+        media_cache = FileService.get_media_cache()
+        # Keep the extension, players pick the reader by it
+        suffix = os.path.splitext(filename)[1]
+        cached_path = media_cache.get_path(project_name, file_id, suffix)
+        if cached_path:
+            if progress_callback:
+                size = os.path.getsize(cached_path)
+                progress_callback(size, size)
+            return cached_path
 
+        try:
+            part_path = media_cache.get_partial_path(project_name, file_id, suffix)
+            if FileService.stream_download(project_name, file_id, part_path, progress_callback, cancel_event):
+                return media_cache.commit_file(project_name, file_id, part_path, suffix)
         except Exception as e:
             print(f"Error downloading file: {e}")
-            return None
+        return None
+
+    @staticmethod
+    def stream_download(project_name: str, file_id: str, part_path: str,
+                        progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+                        cancel_event: Optional[threading.Event] = None) -> bool:
+        """Stream a project file into `part_path`, resuming from the bytes already there.
+
+        Returns True once the file is complete and its size matches the size
+        reported by the server, False when it failed or `cancel_event` was set.
+        """
+        session, server_url = BaseAyonClient.get_session()
+        url = f"{server_url}/api/projects/{project_name}/files/{file_id}"
+        total_size = None
+
+        for attempt in range(DOWNLOAD_RETRIES + 1):
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+            downloaded = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+            # Uncompressed transfer, so sizes and Range offsets count the bytes written to disk
+            headers = {"Accept-Encoding": "identity"}
+            if downloaded:
+                headers["Range"] = f"bytes={downloaded}-"
+            try:
+                with session.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                    if response.status_code == 416:
+                        # Nothing left to download, or a stale partial file
+                        match = _UNSATISFIED_RANGE_TOTAL.match(response.headers.get("Content-Range", ""))
+                        if match and int(match.group(1)) == downloaded:
+                            return True
+                        os.remove(part_path)
+                        continue
+                    if response.status_code == 206:
+                        match = _CONTENT_RANGE_TOTAL.match(response.headers.get("Content-Range", ""))
+                        total_size = int(match.group(1)) if match else total_size
+                        mode = "ab"
+                    elif response.status_code == 200:
+                        # Range not honored, start over
+                        content_length = response.headers.get("Content-Length")
+                        total_size = int(content_length) if content_length else None
+                        downloaded = 0
+                        mode = "wb"
+                    else:
+                        print(f"Download failed ({response.status_code}): {response.text[:200]}")
+                        return False
+
+                    with open(part_path, mode) as part_file:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            if not chunk:
+                                continue
+                            part_file.write(chunk)
+                            downloaded += len(chunk)
+                            if progress_callback:
+                                progress_callback(downloaded, total_size)
+                            if cancel_event is not None and cancel_event.is_set():
+                                return False
+            except requests.RequestException as e:
+                if attempt == DOWNLOAD_RETRIES:
+                    raise
+                print(f"Download of file {file_id} interrupted at {downloaded} bytes, resuming: {e}")
+                continue
+
+            if total_size is None or downloaded == total_size:
+                return True
+            if downloaded > total_size:
+                # Corrupt partial file, download again from scratch
+                os.remove(part_path)
+            print(f"Download of file {file_id} incomplete ({downloaded} of {total_size} bytes), resuming")
+
+        print(f"Download of file {file_id} failed after {DOWNLOAD_RETRIES} retries")
+        return False
 
 
 if __name__ == "__main__":
@@ -1,5 +1,17 @@
-from typing import Optional, List, Dict, Any
-from .base_client import BaseAyonClient
+from typing import Optional, List, Dict, Any, Tuple
+from .base_client import BaseAyonClient, build_updated_since_filter
+from .task_service import SUBMISSION_TASKS_CONDITION
+
+try:
+    from ...constants import ADDON_NAME
+    from ...version import __version__
+except ImportError:
+    from constants import ADDON_NAME
+    from version import __version__
+
+# Upper bound of entities listed by a change check, more changes than this
+# are still detected through the latest update time
+CHANGE_CHECK_LIMIT = 1000
 
 
 class ProjectService(BaseAyonClient):
@@ -13,6 +25,68 @@ class ProjectService(BaseAyonClient):
             print(f"Error getting projects: {e}")
             return []
 
+    def get_addon_settings(self, project_name: Optional[str] = None) -> Dict[str, Any]:
+        """Return settings of this addon, with project overrides when a project is given."""
+        if self.ayon_connection is None:
+            print(f"Connection error: {self.connection_error}")
+            return {}
+        try:
+            return self.ayon_connection.get_addon_settings(ADDON_NAME, __version__, project_name) or {}
+        except Exception as e:
+            print(f"Error getting addon settings: {e}")
+            return {}
+
+    def get_change_stamp(self, project_name: str, updated_since: str) -> Tuple[int, str, int, str]:
+        """Summarize submission tasks and versions updated since a UTC timestamp.
+
+        Returns the count and latest update time of both, cheap to fetch and
+        compare to tell whether a project changed without loading any data.
+        Falls back to counting all updated tasks when the server rejects the
+        submission filter.
+        """
+        version_filter = build_updated_since_filter(updated_since)
+        try:
+            return self._query_change_stamp(
+                project_name, build_updated_since_filter(updated_since, [SUBMISSION_TASKS_CONDITION]), version_filter
+            )
+        except Exception as e:
+            print(f"Server-side submission filter failed, checking all updated tasks: {e}")
+        return self._query_change_stamp(project_name, build_updated_since_filter(updated_since), version_filter)
+
+    def _query_change_stamp(self, project_name: str, task_filter: str,
+                            version_filter: str) -> Tuple[int, str, int, str]:
+        query = """
+        query ($project: String!, $task_filter: String, $version_filter: String, $first: Int!) {
+            project(name: $project) {
+                tasks(filter: $task_filter, first: $first) {
+                    edges { node { updatedAt } }
+                }
+                versions(filter: $version_filter, first: $first) {
+                    edges { node { updatedAt } }
+                }
+            }
+        }
+        """
+        result = self.graphql_read_query(query, {
+            "project": project_name,
+            "task_filter": task_filter,
+            "version_filter": version_filter,
+            "first": CHANGE_CHECK_LIMIT,
+        }) or {}
+        project = (result.get("data") or {}).get("project")
+        if result.get("errors") or not project:
+            raise Exception(f"Change check failed: {result.get('errors')}")
+
+        stamp = []
+        for key in ("tasks", "versions"):
+            updated = [
+                edge["node"].get("updatedAt") or ""
+                for edge in (project.get(key) or {}).get("edges") or []
+                if edge and edge.get("node")
+            ]
+            stamp.extend((len(updated), max(updated, default="")))
+        return tuple(stamp)
+
     def get_lists(self, project_name: str, entity_type: Optional[str] = "version") -> Dict[str, str]:
         if self.ayon_connection is None:
             print(f"Connection error: {self.connection_error}")
@@ -35,17 +109,21 @@ class ProjectService(BaseAyonClient):
            }"""
 
         try:
-            result = self.graphql_query(query, {"project": project_name})
-            lists = {
-                node["node"]["label"]: node["node"]["id"]
-                for node in result["data"]["project"]["entityLists"]["edges"]
-                if entity_type is None or node["node"]["entityType"] == entity_type
-            }
-            return lists
+            result = self.graphql_read_query(query, {"project": project_name})
+            return self.format_lists(result["data"]["project"]["entityLists"], entity_type)
         except Exception as e:
             print(f"Failed to fetch lists for '{project_name}': {e}")
             return {}
 
+    @staticmethod
+    def format_lists(entity_lists: Dict[str, Any], entity_type: Optional[str] = "version") -> Dict[str, str]:
+        """Map list labels to ids from an `entityLists` GraphQL connection."""
+        return {
+            node["node"]["label"]: node["node"]["id"]
+            for node in entity_lists.get("edges") or []
+            if entity_type is None or node["node"]["entityType"] == entity_type
+        }
+
     def get_list_items(self, project_name: str, list_id: str) -> List[Dict[str, Any]]:
         if self.ayon_connection is None:
             print(f"Connection error: {self.connection_error}")
@@ -79,44 +157,6 @@ class ProjectService(BaseAyonClient):
                                   version
                                   product{
                                     name
-                                    versions {
-                                      edges {
-                                        node {
-                                          id
-                                          name
-                                          path
-                                          parents
-                                          status
-                                          createdAt
-                                          productId
-                                          author
-                                          thumbnailId
-                                          version
-                                          task {
-                                            name
-                                            id
-                                            taskType
-                                            status
-                                          }
-                                          hasReviewables
-                                          representations {
-                                            edges {
-                                              node {
-                                                attrib {
-                                                  path
-                                                  description
-                                                  frameEnd
-                                                  frameStart
-                                                  handleEnd
-                                                  handleStart
-                                                  fps
-                                                }
-                                              }
-                                            }
-                                          }
-                                        }
-                                      }
-                                    }
                                   }
                                   task{
                                     name
@@ -125,21 +165,6 @@ class ProjectService(BaseAyonClient):
                                     status
                                   }
                                   hasReviewables
-                                  representations {
-                                    edges {
-                                      node {
-                                        attrib {
-                                          path
-                                          description
-                                          frameEnd
-                                          frameStart
-                                          handleEnd
-                                          handleStart
-                                          fps
-                                        }
-                                      }
-                                    }
-                                  }
                                 }
                               }
                             }
@@ -148,4 +173,4 @@ class ProjectService(BaseAyonClient):
                       }
                     }
                     """
-        return self.graphql_query(query, {"project": project_name, "list_id": list_id})
\ No newline at end of file
+        return self.graphql_read_query(query, {"project": project_name, "list_id": list_id})
\ No newline at end of file
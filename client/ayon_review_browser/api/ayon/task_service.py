@@ -1,14 +1,39 @@
+import json
 from datetime import datetime, timedelta
-from typing import Dict, Any
-from .base_client import BaseAyonClient
+from typing import Dict, Any, Iterator, List, Optional
+from .base_client import BaseAyonClient, build_updated_since_filter
+
+# Number of tasks requested per GraphQL page
+TASKS_PAGE_SIZE = 500
+
+# Query filter condition matching tasks whose data contains review submission info
+SUBMISSION_TASKS_CONDITION = {"key": "data.submission_data", "operator": "notnull"}
+SUBMISSION_TASKS_FILTER = json.dumps({"conditions": [SUBMISSION_TASKS_CONDITION]})
 
 
 class TaskService(BaseAyonClient):
     def get_tasks(self, project_name: str) -> Dict[str, Any]:
+        edges = [
+            {"node": node}
+            for page in self.iter_task_pages(project_name)
+            for node in page
+        ]
+        return {"data": {"project": {"tasks": {"edges": edges}}}}
+
+    def iter_task_pages(self, project_name: str, page_size: int = TASKS_PAGE_SIZE,
+                        filter_json: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield task nodes of a project page by page using cursor pagination.
+
+        `filter_json` is an optional AYON query filter evaluated by the server.
+        """
         query = """
-                query ($project: String!) {
+                query ($project: String!, $first: Int!, $after: String, $filter: String) {
                     project(name: $project) {
-                        tasks (first: 10000){
+                        tasks (first: $first, after: $after, filter: $filter){
+                            pageInfo {
+                                hasNextPage
+                                endCursor
+                            }
                             edges {
                                 node {
                                     data
@@ -16,23 +41,11 @@ class TaskService(BaseAyonClient):
                                     name 
                                     status
                                     id
-                                    thumbnailId
+                                    updatedAt
                                     folder {
-                                        id
                                         name
-                                        path
-                                        type
                                         parent {
-                                            id
                                             name
-                                            path
-                                            type
-                                            parent {
-                                                id
-                                                name
-                                                path
-                                                type
-                                            }
                                         }
                                     }
                                 }
@@ -41,7 +54,46 @@ class TaskService(BaseAyonClient):
                     }
                 }
                 """
-        return self.graphql_query(query, {"project": project_name})
+        cursor = None
+        while True:
+            result = self.graphql_read_query(
+                query, {"project": project_name, "first": page_size, "after": cursor, "filter": filter_json}
+            ) or {}
+            project = (result.get("data") or {}).get("project") or {}
+            if result.get("errors") and not project:
+                raise Exception(f"Task query failed: {result['errors']}")
+            tasks = project.get("tasks") or {}
+
+            nodes = [edge["node"] for edge in tasks.get("edges") or [] if edge and edge.get("node")]
+            if nodes:
+                yield nodes
+
+            page_info = tasks.get("pageInfo") or {}
+            cursor = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not cursor:
+                break
+
+    def iter_submission_task_pages(self, project_name: str, page_size: int = TASKS_PAGE_SIZE,
+                                   updated_since: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of tasks that carry submission data.
+
+        Tasks are filtered on the server so the data blobs of other tasks are
+        never transferred. Falls back to fetching all tasks when the server
+        rejects the filter. With `updated_since` only tasks updated at or
+        after that UTC timestamp are returned.
+        """
+        submission_filter = build_updated_since_filter(updated_since, [SUBMISSION_TASKS_CONDITION])
+        pages = self.iter_task_pages(project_name, page_size, submission_filter)
+        try:
+            first_page = next(pages, None)
+        except Exception as e:
+            print(f"Server-side submission filter failed, fetching all tasks: {e}")
+            yield from self.iter_task_pages(project_name, page_size, build_updated_since_filter(updated_since))
+            return
+
+        if first_page is not None:
+            yield first_page
+            yield from pages
 
     def get_recent_tasks_count(self, project_name: str, days: int = 7) -> int:
         date_filter = (datetime.now() - timedelta(days=days)).isoformat() + "Z"
@@ -65,7 +117,7 @@ class TaskService(BaseAyonClient):
         filter_json = f'{{"conditions":[{{"key":"updatedAt","operator":"gte","value":"{date_filter}"}}]}}'
 
         try:
-            result = self.graphql_query(query, {"project": project_name, "filter": filter_json})
+            result = self.graphql_read_query(query, {"project": project_name, "filter": filter_json})
             if result and "data" in result and result["data"] and "project" in result["data"]:
                 project_data = result["data"]["project"]
                 if project_data and "tasks" in project_data and project_data["tasks"]:
@@ -1,34 +1,73 @@
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
-from .base_client import BaseAyonClient
+from .base_client import BaseAyonClient, build_updated_since_filter
+
+try:
+    from ...constants import CACHE_ROOT_DIR, THUMBNAIL_CACHE_MAX_BYTES
+    from ...utils.disk_cache import DiskCache
+except ImportError:
+    from constants import CACHE_ROOT_DIR, THUMBNAIL_CACHE_MAX_BYTES
+    from utils.disk_cache import DiskCache
 
 logger = logging.getLogger(__name__)
 
+# Number of version ids resolved per GraphQL request
+VERSION_DETAILS_CHUNK_SIZE = 200
+# Concurrent requests used to look up reviewables of many versions
+REVIEWABLES_WORKERS = 8
+# Number of versions requested per GraphQL page
+VERSIONS_PAGE_SIZE = 1000
+
 
 class VersionService(BaseAyonClient):
-    def get_version_thumbnail_to_local(self, project_name: str, version_id: str) -> Optional[str]:
-        if self.ayon_connection is None:
-            logger.error(f"Connection error: {self.connection_error}")
+    def __init__(self) -> None:
+        super().__init__()
+        self.thumbnail_cache = DiskCache(
+            os.path.join(CACHE_ROOT_DIR, "thumbnails"), THUMBNAIL_CACHE_MAX_BYTES, suffix=".jpg"
+        )
+
+    def get_version_thumbnail_to_local(self, project_name: str, version_id: str,
+                                       thumbnail_id: Optional[str] = None) -> Optional[str]:
+        if thumbnail_id:
+            cached_path = self.thumbnail_cache.get_path(project_name, thumbnail_id)
+            if cached_path:
+                return cached_path
+
+        thumbnail = self._fetch_version_thumbnail(project_name, version_id)
+        if thumbnail is None:
             return None
-        try:
-            thumbnail = self.ayon_connection.get_version_thumbnail(project_name, version_id=version_id)
-            import tempfile
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as temp_thumb:
-                temp_thumb.write(thumbnail.content)
-                return temp_thumb.name
-        except Exception as e:
-            logger.error(f"Error getting thumbnail for version {version_id}: {e}")
+
+        cache_key = getattr(thumbnail, 'thumbnail_id', None) or thumbnail_id or f"version:{version_id}"
+        return self.thumbnail_cache.put(project_name, cache_key, thumbnail.content)
+
+    def get_version_thumbnail_data(self, project_name: str, version_id: str,
+                                   thumbnail_id: Optional[str] = None) -> Optional[bytes]:
+        if thumbnail_id:
+            cached_data = self.thumbnail_cache.get(project_name, thumbnail_id)
+            if cached_data is not None:
+                return cached_data
+
+        thumbnail = self._fetch_version_thumbnail(project_name, version_id)
+        if thumbnail is None:
             return None
 
-    def get_version_thumbnail_data(self, project_name: str, version_id: str) -> Optional[bytes]:
+        cache_key = getattr(thumbnail, 'thumbnail_id', None) or thumbnail_id
+        if cache_key:
+            self.thumbnail_cache.put(project_name, cache_key, thumbnail.content)
+        return thumbnail.content
+
+    def _fetch_version_thumbnail(self, project_name: str, version_id: str):
+        """Download version thumbnail from the server, bypassing the cache."""
         if self.ayon_connection is None:
             logger.error(f"Connection error: {self.connection_error}")
             return None
 
         try:
             thumbnail = self.ayon_connection.get_version_thumbnail(project_name, version_id=version_id)
-            if thumbnail and hasattr(thumbnail, 'content'):
-                return thumbnail.content
+            if thumbnail and getattr(thumbnail, 'content', None):
+                return thumbnail
             return None
         except Exception as e:
             logger.error(f"Error getting thumbnail data for version {version_id}: {e}")
@@ -43,72 +82,270 @@ class VersionService(BaseAyonClient):
             logger.error(f"Error getting versions for project {project_name}: {e}")
             return []
 
+    def get_product_versions(self, project_name: str, product_ids: List[str],
+                             chunk_size: int = VERSION_DETAILS_CHUNK_SIZE) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch all versions of many products, grouped by product id.
+
+        Only the fields shown in the version tables are fetched, without
+        representations. Products are requested in chunks, each paginated.
+        """
+        query = """
+        query ($project: String!, $product_ids: [String!]!, $first: Int!, $after: String) {
+            project(name: $project) {
+                versions(productIds: $product_ids, first: $first, after: $after) {
+                    pageInfo {
+                        hasNextPage
+                        endCursor
+                    }
+                    edges {
+                        node {
+                            id
+                            name
+                            status
+                            createdAt
+                            productId
+                            author
+                            thumbnailId
+                            version
+                            hasReviewables
+                            task {
+                                name
+                                id
+                                taskType
+                                status
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        """
+        unique_ids = list(dict.fromkeys(pid for pid in product_ids if pid and pid != "N/A"))
+        product_versions = {product_id: [] for product_id in unique_ids}
+
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start:start + chunk_size]
+            cursor = None
+            while True:
+                try:
+                    result = self.graphql_read_query(query, {
+                        "project": project_name, "product_ids": chunk,
+                        "first": VERSIONS_PAGE_SIZE, "after": cursor
+                    })
+                    versions = (((result or {}).get("data") or {}).get("project") or {}).get("versions") or {}
+                except Exception as e:
+                    logger.error(f"Error getting versions of {len(chunk)} products: {e}")
+                    break
+
+                for edge in versions.get("edges") or []:
+                    node = (edge or {}).get("node")
+                    if node and node.get("productId") in product_versions:
+                        product_versions[node["productId"]].append(node)
+
+                page_info = versions.get("pageInfo") or {}
+                cursor = page_info.get("endCursor")
+                if not page_info.get("hasNextPage") or not cursor:
+                    break
+
+        return product_versions
+
+    def get_versions_representations(self, project_name: str, version_ids: List[str],
+                                     chunk_size: int = VERSION_DETAILS_CHUNK_SIZE) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch representation attributes of many versions, keyed by version id."""
+        query = """
+        query ($project: String!, $version_ids: [String!]!, $first: Int!) {
+            project(name: $project) {
+                versions(ids: $version_ids, first: $first) {
+                    edges {
+                        node {
+                            id
+                            representations {
+                                edges {
+                                    node {
+                                        attrib {
+                                            path
+                                            description
+                                            frameEnd
+                                            frameStart
+                                            handleEnd
+                                            handleStart
+                                            fps
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        """
+        unique_ids = list(dict.fromkeys(vid for vid in version_ids if vid and vid != "N/A"))
+        representations = {}
+
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start:start + chunk_size]
+            try:
+                result = self.graphql_read_query(
+                    query, {"project": project_name, "version_ids": chunk, "first": len(chunk)}
+                )
+                project = ((result or {}).get("data") or {}).get("project") or {}
+                edges = (project.get("versions") or {}).get("edges") or []
+            except Exception as e:
+                logger.error(f"Error getting representations of {len(chunk)} versions: {e}")
+                continue
+
+            for edge in edges:
+                version_data = (edge or {}).get("node")
+                if version_data and version_data.get("id"):
+                    representations[version_data["id"]] = self._parse_representations(version_data)
+
+        return representations
+
     def get_version_details(self, project_name: str, version_id: str) -> Dict[str, Any]:
-        try:
-            query = """
-            query ($project: String!, $version_id: String!) {
-                project(name: $project) {
-                    version(id: $version_id) {
-                        representations {
-                            edges {
-                              node {
-                                attrib {
+        details = self.get_versions_details(project_name, [version_id], include_representations=True)
+        return details.get(version_id, {'representations': [], 'meta_data': {}})
+
+    def get_versions_details(self, project_name: str, version_ids: List[str],
+                             chunk_size: int = VERSION_DETAILS_CHUNK_SIZE,
+                             include_representations: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Resolve details for many versions in chunked GraphQL queries.
+
+        Returns a mapping of version id to the same structure returned by
+        `get_version_details`. Versions that could not be resolved are missing
+        from the result. Representations are left empty unless requested,
+        use `get_versions_representations` to fetch them on demand.
+        """
+        query = """
+        query ($project: String!, $version_ids: [String!]!, $first: Int!, $representations: Boolean!) {
+            project(name: $project) {
+                versions(ids: $version_ids, first: $first) {
+                    edges {
+                        node {
+                            id
+                            representations @include(if: $representations) {
+                                edges {
+                                  node {
+                                    attrib {
+                                      path
+                                      description
+                                      frameEnd
+                                      frameStart
+                                      handleEnd
+                                      handleStart
+                                      fps
+                                    }
+                                  }
+                                }
+                              }
+                              thumbnailId
+                              version
+                              productId
+                              product {
+                                name
+                                folder{
                                   path
-                                  description
-                                  frameEnd
-                                  frameStart
-                                  handleEnd
-                                  handleStart
-                                  fps
                                 }
                               }
-                            }
-                          }
-                          thumbnailId
-                          version
-                          productId
-                          product {
-                            name
-                            folder{
-                              path
-                            }
-                          }
-                          hasReviewables
-                          name
-                          status
+                              hasReviewables
+                              name
+                              status
                         }
-                      }
                     }
-            """
-            result = self.graphql_query(query, {"project": project_name, "version_id": version_id})
-
-            if not result or not result.get("data") or not result.get("data").get("project") or not result.get(
-                    "data").get("project").get("version"):
-                return {'representations': [], 'meta_data': {}}
-
-            version_data = result["data"]["project"]["version"]
-
-            representations = []
-            if version_data.get("representations") and version_data["representations"].get("edges"):
-                representations = [
-                    node["node"]["attrib"]
-                    for node in version_data["representations"]["edges"]
-                    if node and node.get("node") and node["node"].get("attrib")
-                ]
-
-            meta_data = {
-                key: version_data.get(key, "N/A")
-                for key in ('hasReviewables', 'productId', 'thumbnailId',
-                            'version', 'name', 'status', 'product')
+                }
             }
+        }
+        """
+        unique_ids = list(dict.fromkeys(vid for vid in version_ids if vid and vid != "N/A"))
+        details = {}
+
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start:start + chunk_size]
+            try:
+                result = self.graphql_read_query(query, {
+                    "project": project_name, "version_ids": chunk, "first": len(chunk),
+                    "representations": include_representations
+                })
+                project = ((result or {}).get("data") or {}).get("project") or {}
+                edges = (project.get("versions") or {}).get("edges") or []
+            except Exception as e:
+                logger.error(f"Error getting details for {len(chunk)} versions: {e}")
+                continue
+
+            for edge in edges:
+                version_data = (edge or {}).get("node")
+                if version_data and version_data.get("id"):
+                    details[version_data["id"]] = self._parse_version_details(version_data)
+
+        return details
 
-            return {
-                'representations': representations,
-                'meta_data': meta_data
+    def get_updated_version_ids(self, project_name: str, updated_since: str,
+                                page_size: int = VERSIONS_PAGE_SIZE) -> List[str]:
+        """Return ids of versions updated at or after the `updated_since` UTC timestamp."""
+        query = """
+        query ($project: String!, $filter: String, $first: Int!, $after: String) {
+            project(name: $project) {
+                versions(filter: $filter, first: $first, after: $after) {
+                    pageInfo {
+                        hasNextPage
+                        endCursor
+                    }
+                    edges {
+                        node {
+                            id
+                        }
+                    }
+                }
             }
-        except Exception as e:
-            logger.error(f"Error getting representations for version {version_id}: {e}")
-            return {'representations': [], 'meta_data': {}}
+        }
+        """
+        filter_json = build_updated_since_filter(updated_since)
+        version_ids = []
+        cursor = None
+        while True:
+            result = self.graphql_read_query(
+                query, {"project": project_name, "filter": filter_json, "first": page_size, "after": cursor}
+            ) or {}
+            project = (result.get("data") or {}).get("project") or {}
+            if result.get("errors") and not project:
+                raise Exception(f"Version query failed: {result['errors']}")
+            versions = project.get("versions") or {}
+
+            version_ids.extend(
+                edge["node"]["id"] for edge in versions.get("edges") or []
+                if edge and edge.get("node") and edge["node"].get("id")
+            )
+
+            page_info = versions.get("pageInfo") or {}
+            cursor = page_info.get("endCursor")
+            if not page_info.get("hasNextPage") or not cursor:
+                break
+        return version_ids
+
+    @staticmethod
+    def _parse_representations(version_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if not version_data.get("representations") or not version_data["representations"].get("edges"):
+            return []
+        return [
+            node["node"]["attrib"]
+            for node in version_data["representations"]["edges"]
+            if node and node.get("node") and node["node"].get("attrib")
+        ]
+
+    @classmethod
+    def _parse_version_details(cls, version_data: Dict[str, Any]) -> Dict[str, Any]:
+        representations = cls._parse_representations(version_data)
+
+        meta_data = {
+            key: version_data.get(key, "N/A")
+            for key in ('hasReviewables', 'productId', 'thumbnailId',
+                        'version', 'name', 'status', 'product')
+        }
+
+        return {
+            'representations': representations,
+            'meta_data': meta_data
+        }
 
     def update_version_status(self, project_name: str, version_id: str, status: str) -> bool:
         """Update version status."""
@@ -123,6 +360,33 @@ class VersionService(BaseAyonClient):
             logger.error(f"Error updating version {version_id} status to {status}: {e}")
             return False
 
+    def get_versions_reviewables(self, project_name: str, version_ids: List[str],
+                                 max_workers: int = REVIEWABLES_WORKERS) -> Dict[str, List[Dict[str, Any]]]:
+        """Get reviewables of many versions with concurrent requests on the shared session.
+
+        Returns a mapping of version id to its reviewables. Versions whose
+        lookup failed are missing from the result.
+        """
+        unique_ids = list(dict.fromkeys(vid for vid in version_ids if vid and vid != "N/A"))
+        if not unique_ids:
+            return {}
+        session, server_url = self.get_session()
+
+        def fetch(version_id):
+            try:
+                response = session.get(
+                    f"{server_url}/api/projects/{project_name}/versions/{version_id}/reviewables", timeout=30
+                )
+                response.raise_for_status()
+                return version_id, response.json().get('reviewables') or []
+            except Exception as e:
+                logger.error(f"Error getting reviewables for version {version_id}: {e}")
+                return version_id, None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+            results = executor.map(fetch, unique_ids)
+            return {version_id: reviewables for version_id, reviewables in results if reviewables is not None}
+
     def get_version_reviewables(self, project_name: str, version_id: str) -> List[Dict[str, Any]]:
         """Get reviewables for a version."""
         if self.ayon_connection is None:
@@ -4,3 +4,11 @@ import os
 REVIEW_BROWSER_ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 ADDON_NAME = "ayon_review_browser"
 ADDON_LABEL = "Review Browser"
+
+# Root directory for locally cached data
+CACHE_ROOT_DIR = os.environ.get("AYON_REVIEW_BROWSER_CACHE_DIR") or os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "ayon_review_browser"
+)
+THUMBNAIL_CACHE_MAX_BYTES = 512 * 1024 * 1024
+MEDIA_CACHE_MAX_BYTES = 20 * 1024 * 1024 * 1024
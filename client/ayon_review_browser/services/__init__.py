@@ -1,3 +1,9 @@
 from .data_service import DataService
+from .download_manager import DownloadManager
+from .project_loader import ProjectLoader
+from .refresh_poller import RefreshPoller
+from .snapshot_store import SnapshotStore
+from .thumbnail_loader import ThumbnailLoader
+from .version_row import VersionRow
 
-__all__ = ['DataService']
\ No newline at end of file
+__all__ = ['DataService', 'DownloadManager', 'ProjectLoader', 'RefreshPoller', 'SnapshotStore', 'ThumbnailLoader', 'VersionRow']
@@ -1,6 +1,8 @@
 import json
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pprint import pprint
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -8,17 +10,53 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from api.ayon import AyonClient
 from utils.date_utils import standardize_date, filter_by_date_simple as filter_by_date
 
+try:
+    from ..constants import CACHE_ROOT_DIR
+    from .snapshot_store import SnapshotStore
+    from .version_row import VersionRow
+except ImportError:
+    from constants import CACHE_ROOT_DIR
+    from services.snapshot_store import SnapshotStore
+    from services.version_row import VersionRow
+
+# Incremental refreshes re-read changes made this long before the previous
+# sync started, covering writes in flight and clock skew against the server
+SYNC_OVERLAP_SECONDS = 300
+
+
+def _sync_timestamp():
+    """Return the high-water mark for a sync starting now, as a UTC timestamp."""
+    started = datetime.now(timezone.utc) - timedelta(seconds=SYNC_OVERLAP_SECONDS)
+    return started.strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+
+
+class LoadCancelled(Exception):
+    """Raised inside a data load when it was cancelled by the caller."""
+
 
 class DataService:
     def __init__(self):
         self.api = AyonClient()
         self.current_project = None
+        # project name -> UTC timestamp the last complete load covers changes from
+        self._sync_marks = {}
+        # project name -> change stamp of the project taken when the last sync started
+        self._change_stamps = {}
+        # (project name, product id) -> versions of the product, latest first;
+        # one list shared by every list row of that product
+        self._product_versions = {}
+        # version id -> representation attributes, fetched on demand
+        self._representations = {}
+        # version id -> reviewables, fetched on demand
+        self._reviewables = {}
+        self.snapshot_store = SnapshotStore(os.path.join(CACHE_ROOT_DIR, "snapshots.sqlite"))
 
     def fetch_projects(self):
         return self.api.get_projects()
 
     def set_project(self, project_name):
         self.current_project = project_name
+        self.clear_version_caches()
 
     def fetch_version_statuses(self, project_name=None):
         """Fetch dynamic version statuses for the project."""
@@ -43,20 +81,245 @@ class DataService:
         statuses = self.fetch_version_statuses(project_name)
         return {status['value']: status.get('color', '#ffffff') for status in statuses if status.get('value') != 'All'}
 
-    def fetch_versions(self, project_name=None, date_filter="ALL"):
+    def load_project_data(self, project_name, progress_callback=None, cancel_event=None, rows_callback=None):
+        """Fetch everything the browser shows for a project.
+
+        Meant to run on a worker thread. `progress_callback(message, percent)`
+        is called before each step (percent is -1 while the total is
+        unknown), `rows_callback(rows)` receives each page of review rows as
+        it arrives, and `LoadCancelled` is raised once `cancel_event` is set.
+        """
+        def report(message, percent):
+            if cancel_event is not None and cancel_event.is_set():
+                raise LoadCancelled(project_name)
+            if progress_callback:
+                progress_callback(message, percent)
+
+        loaded_count = [0]
+
+        def on_rows_loaded(rows):
+            loaded_count[0] += len(rows)
+            if rows_callback:
+                rows_callback(rows)
+            report(f"Loaded {loaded_count[0]} review submissions...", -1)
+
+        sync_mark = _sync_timestamp()
+        self.clear_version_caches()
+        report("Loading review submissions and project metadata...", 0)
+        # Metadata, settings and change stamp are small queries, run them
+        # alongside the submissions load
+        executor = ThreadPoolExecutor(max_workers=4)
+        try:
+            metadata_future = executor.submit(self.fetch_project_metadata, project_name)
+            interval_future = executor.submit(self.fetch_auto_refresh_interval, project_name)
+            stamp_future = executor.submit(self._fetch_change_stamp, project_name, sync_mark)
+            versions_future = executor.submit(
+                self.fetch_versions, project_name, "ALL", on_rows_loaded, cancel_event
+            )
+            metadata = metadata_future.result()
+            report("Loading review submissions...", 10)
+            versions = versions_future.result()
+            auto_refresh_interval = interval_future.result()
+            change_stamp = stamp_future.result()
+        finally:
+            # Don't wait for requests of a cancelled load
+            executor.shutdown(wait=False)
+        report("Done", 100)
+        self._sync_marks[project_name] = sync_mark
+        self._change_stamps[project_name] = change_stamp
+        self.snapshot_store.save(project_name, versions, metadata)
+
+        return {
+            "versions": versions,
+            "playlists": metadata["lists"],
+            "statuses": metadata["statuses"],
+            "task_types": metadata["task_types"],
+            "auto_refresh_interval": auto_refresh_interval,
+        }
+
+    def load_snapshot(self, project_name):
+        """Return rows and metadata saved by the last load of a project, or None.
+
+        Reads only local data, so the project can be shown right away while
+        it is loaded from the server in the background.
+        """
+        snapshot = self.snapshot_store.load(project_name)
+        if snapshot is None:
+            return None
+        metadata = snapshot["metadata"]
+        return {
+            "versions": snapshot["rows"],
+            "playlists": metadata.get("lists") or {},
+            "statuses": metadata.get("statuses") or [{"value": "All"}],
+            "task_types": metadata.get("task_types") or [{"value": "All"}],
+            "saved_at": snapshot["saved_at"],
+        }
+
+    def save_snapshot(self, project_name, rows, updates):
+        """Save refreshed rows of a project in the background; `updates` is a `load_project_updates` result."""
+        metadata = {
+            "lists": updates["playlists"],
+            "statuses": updates["statuses"],
+            "task_types": updates["task_types"],
+        }
+        self.snapshot_store.save_async(project_name, rows, metadata)
+
+    def has_sync_mark(self, project_name):
+        """Return True when the project was loaded and can be refreshed incrementally."""
+        return project_name in self._sync_marks
+
+    def load_project_updates(self, project_name, known_version_ids=(), progress_callback=None, cancel_event=None):
+        """Fetch only what changed in a project since its last load or refresh.
+
+        Meant to run on a worker thread, like `load_project_data`. Returns
+        review rows of submission tasks updated since the high-water mark
+        and fresh details of the `known_version_ids` updated since then,
+        along with the project metadata. Apply the result with
+        `merge_version_updates`.
+        """
+        updated_since = self._sync_marks.get(project_name)
+        if updated_since is None:
+            raise ValueError(f"Project '{project_name}' has not been loaded yet")
+
+        def check_cancelled():
+            if cancel_event is not None and cancel_event.is_set():
+                raise LoadCancelled(project_name)
+
+        sync_mark = _sync_timestamp()
+        self.clear_version_caches()
+        if progress_callback:
+            progress_callback("Checking for updates...", -1)
+        change_stamp = self._fetch_change_stamp(project_name, sync_mark)
+
+        rows = []
+        for task_nodes in self.api.iter_submission_task_pages(project_name, updated_since=updated_since):
+            check_cancelled()
+            rows.extend(self._build_submission_rows(project_name, task_nodes))
+
+        check_cancelled()
+        # Rows rebuilt above already carry fresh version details
+        rebuilt_version_ids = {row.get("version_id") for row in rows}
+        known_version_ids = set(known_version_ids) - rebuilt_version_ids
+        updated_version_ids = [
+            version_id
+            for version_id in self.api.get_updated_version_ids(project_name, updated_since)
+            if version_id in known_version_ids
+        ]
+        versions = self.api.get_versions_details(project_name, updated_version_ids)
+
+        check_cancelled()
+        metadata = self.fetch_project_metadata(project_name)
+        self._sync_marks[project_name] = sync_mark
+        self._change_stamps[project_name] = change_stamp
+        if progress_callback:
+            progress_callback(f"Updated {len(rows) + len(versions)} review submissions", 100)
+
+        return {
+            "rows": rows,
+            "versions": versions,
+            "playlists": metadata["lists"],
+            "statuses": metadata["statuses"],
+            "task_types": metadata["task_types"],
+        }
+
+    def has_project_updates(self, project_name):
+        """Cheaply check whether a loaded project changed since its last sync.
+
+        Compares counts and latest update times of submission tasks and
+        versions instead of loading them. Returns False for projects that
+        were not loaded yet and when the check itself fails.
+        """
+        updated_since = self._sync_marks.get(project_name)
+        if updated_since is None:
+            return False
+        change_stamp = self._fetch_change_stamp(project_name, updated_since)
+        if change_stamp is None:
+            print(f"Could not check project '{project_name}' for updates, auto-refresh skipped")
+            return False
+        return change_stamp != self._change_stamps.get(project_name)
+
+    def _fetch_change_stamp(self, project_name, updated_since):
+        try:
+            return self.api.get_change_stamp(project_name, updated_since)
+        except Exception as e:
+            print(f"Error checking project '{project_name}' for updates: {e}")
+            return None
+
+    def fetch_auto_refresh_interval(self, project_name=None):
+        """Return the configured auto-refresh interval in seconds, 0 when disabled."""
+        settings = self.api.get_addon_settings(project_name or self.current_project)
+        try:
+            return max(0, int((settings.get("ui") or {}).get("auto_refresh_interval") or 0))
+        except (TypeError, ValueError):
+            return 0
+
+    def merge_version_updates(self, rows, updates):
+        """Return a new row list with the result of `load_project_updates` applied.
+
+        Changed rows are replaced by new objects, so table models updated
+        with the result refresh just those rows. New submissions are added
+        and the list is sorted latest first again, since resubmitted tasks
+        move to the top like they do on a full load.
+        """
+        updated_rows = {row.get("task_id"): row for row in updates.get("rows", [])}
+        versions = updates.get("versions", {})
+
+        merged = []
+        for row in rows:
+            task_id = row.get("task_id")
+            if task_id in updated_rows:
+                merged.append(updated_rows.pop(task_id))
+                continue
+
+            version = versions.get(row.get("version_id"))
+            if version is not None:
+                row = row.copy()
+                for key, value in self._version_row_fields(version).items():
+                    row[key] = value
+            merged.append(row)
+
+        merged.extend(updated_rows.values())
+        merged.sort(key=lambda x: x.get('submitted_at', ''), reverse=True)
+        return merged
+
+    def fetch_project_metadata(self, project_name=None):
+        """Fetch version statuses, task types and version lists in one request."""
+        project = project_name or self.current_project
+        if not project:
+            return {"statuses": [{"value": "All"}], "task_types": [{"value": "All"}], "lists": {}}
+        return self.api.get_project_metadata(project, "version")
+
+    def fetch_versions(self, project_name=None, date_filter="ALL", rows_callback=None, cancel_event=None):
         project = project_name or self.current_project
         if not project:
             return []
-        tasks = self.api.get_tasks(project)
-        try:
-            tasks_data = tasks.get("data", {}).get("project", {}).get("tasks", {}).get("edges", [])
-        except AttributeError as e:
-            print(f"Error accessing tasks data: {e}")
-            return []
+
         result = []
+        for rows in self.iter_versions(project, cancel_event):
+            result.extend(rows)
+            if rows_callback:
+                rows_callback(rows)
+
+        filtered_result = filter_by_date(result, date_filter)
+        # Sort by date, latest first
+        filtered_result.sort(key=lambda x: x.get('submitted_at', ''), reverse=True)
+        return filtered_result
+
+    def iter_versions(self, project_name, cancel_event=None):
+        """Yield review submission rows page by page while tasks are fetched."""
+        for task_nodes in self.api.iter_submission_task_pages(project_name):
+            if cancel_event is not None and cancel_event.is_set():
+                raise LoadCancelled(project_name)
+
+            rows = self._build_submission_rows(project_name, task_nodes)
+            if rows:
+                yield rows
 
-        for task in tasks_data:
-            task_node = task.get("node") or {}
+    def _build_submission_rows(self, project, task_nodes):
+        """Build review rows for the tasks carrying submission data."""
+        submissions = []
+
+        for task_node in task_nodes:
             raw_task_data = task_node.get("data")
 
             task_data = {}
@@ -69,55 +332,57 @@ class DataService:
                     print(e)
 
             if "submission_data" in task_data:
-                folder = task_node.get("folder") or {}
-                parent = folder.get("parent") or {}
-
-                sequence_name = parent.get("name") if parent else "N/A"
-                shot_name = folder.get("name") if folder else "N/A"
-                task_id = task_node.get("id") if task_node else "N/A"
-                task_name = task_node.get("name") if task_node else "N/A"
-                task_type = task_node.get("type") if task_node else "N/A"
-                task_status = task_node.get("status") if task_node else "N/A"
-                task_thumbnail_id = task_node.get("thumbnailId") if task_node else "N/A"
-
                 submission_data = task_data.get("submission_data", {})
                 version_id = submission_data.get("version_id") or submission_data.get("workfile_version_id", "N/A")
+                submissions.append((task_node, submission_data, version_id))
 
-                version = self.api.get_version_details(self.current_project, version_id=version_id)
-                if isinstance(version, dict) and version.get("meta_data", {}).get("thumbnailId"):
-                    thumbnail_data = self.api.get_version_thumbnail_data(self.current_project, version_id)
-                else:
-                    thumbnail_data = None
-
-                result.append({
-                    "sequence_name": sequence_name,
-                    "shot_name": shot_name,
-                    "task_name": task_name,
-                    "task_type": task_type,
-                    "task_status": task_status,
-                    "author": submission_data.get("submitter_name", "N/A"),
-                    "submission_type": submission_data.get("submission_type", "N/A"),
-                    "submitted_at": standardize_date(submission_data.get("submitted_at", "N/A")),
-                    "version_id": version_id,
-                    "reviewer_name": submission_data.get("reviewer_name", "N/A"),
-                    "versions": [version.get("meta_data", {}).get("name", "N/A")] if isinstance(version, dict) else [
-                        "N/A"],
-                    "product_id": version.get("meta_data", {}).get("productId", "N/A") if isinstance(version,
-                                                                                                     dict) else "N/A",
-                    "product": version.get("meta_data", {}).get("product", {}).get("name", "N/A") if isinstance(version,
-                                                                                                                dict) else "N/A",
-                    "version_status": version.get("meta_data", {}).get("status", "N/A") if isinstance(version,
-                                                                                                      dict) else "N/A",
-                    "task_id": task_id,
-                    "thumbnail_data": thumbnail_data,
-                    "representations": version.get("representations", []) if isinstance(version, dict) else [],
-                    "path": version.get("meta_data", {}).get("product", {}).get("folder", {}).get("path", "N/A")
-                })
+        # Resolve all submitted versions in a few batched requests, then join locally
+        versions_details = self.api.get_versions_details(project, [item[2] for item in submissions])
+        result = []
 
-        filtered_result = filter_by_date(result, date_filter)
-        # Sort by date, latest first
-        filtered_result.sort(key=lambda x: x.get('submitted_at', ''), reverse=True)
-        return filtered_result
+        for task_node, submission_data, version_id in submissions:
+            folder = task_node.get("folder") or {}
+            parent = folder.get("parent") or {}
+
+            sequence_name = parent.get("name") if parent else "N/A"
+            shot_name = folder.get("name") if folder else "N/A"
+            task_id = task_node.get("id") if task_node else "N/A"
+            task_name = task_node.get("name") if task_node else "N/A"
+            task_type = task_node.get("type") if task_node else "N/A"
+            task_status = task_node.get("status") if task_node else "N/A"
+
+            version = versions_details.get(version_id, {'meta_data': {}})
+
+            result.append(VersionRow(**{
+                "sequence_name": sequence_name,
+                "shot_name": shot_name,
+                "task_name": task_name,
+                "task_type": task_type,
+                "task_status": task_status,
+                "author": submission_data.get("submitter_name", "N/A"),
+                "submission_type": submission_data.get("submission_type", "N/A"),
+                "submitted_at": standardize_date(submission_data.get("submitted_at", "N/A")),
+                "version_id": version_id,
+                "reviewer_name": submission_data.get("reviewer_name", "N/A"),
+                "task_id": task_id,
+                **self._version_row_fields(version)
+            }))
+
+        return result
+
+    @staticmethod
+    def _version_row_fields(version):
+        """Row fields taken from a version resolved by `get_versions_details`."""
+        meta_data = version.get("meta_data", {})
+        return {
+            "versions": [meta_data.get("name", "N/A")],
+            "product_id": meta_data.get("productId", "N/A"),
+            "product": (meta_data.get("product") or {}).get("name", "N/A"),
+            "version_status": meta_data.get("status", "N/A"),
+            "thumbnail_id": meta_data.get("thumbnailId"),
+            "path": ((meta_data.get("product") or {}).get("folder") or {}).get("path", "N/A"),
+            "hasReviewables": meta_data.get("hasReviewables")
+        }
 
     def fetch_playlists(self, project_name=None):
         project = project_name or self.current_project
@@ -149,56 +414,94 @@ class DataService:
             "data").get("project").get("entityList").get("items"):
             return []
         list_versions_data = list_versions.get("data").get("project").get("entityList").get("items").get("edges", [])
-        result = []
+        list_version_nodes = [edge.get("node") for edge in list_versions_data if edge.get("node")]
 
-        for list_version in list_versions_data:
-            list_version_node = list_version.get("node")
-            product = list_version_node.get("product", {})
-
-            # Extract all versions for this product and standardize dates
-            all_product_versions = []
-            if product.get("versions", {}).get("edges"):
-                for edge in product["versions"]["edges"]:
-                    if edge.get("node"):
-                        node = edge["node"].copy()
-                        node['createdAt'] = standardize_date(node.get('createdAt', 'N/A'))
-                        all_product_versions.append(node)
-
-            # Process current version data
-            version_data = self._process_version_data(list_version_node, all_product_versions)
-            result.append(version_data)
+        # Versions of each product are fetched once and shared by all its rows
+        product_versions = self.fetch_product_versions(
+            project, [node.get("productId") for node in list_version_nodes]
+        )
+        result = [
+            self._process_version_data(node, product_versions.get(node.get("productId"), []))
+            for node in list_version_nodes
+        ]
 
         filtered_result = filter_by_date(result, date_filter)
         # Sort by date, latest first
         filtered_result.sort(key=lambda x: x.get('created_at', ''), reverse=True)
         return filtered_result
 
+    def fetch_product_versions(self, project_name, product_ids):
+        """Return versions of products keyed by product id, latest first.
+
+        Products fetched before are served from the shared index, the rest
+        are fetched in one batch. The returned lists are shared, don't
+        modify them.
+        """
+        missing_ids = [
+            product_id for product_id in dict.fromkeys(product_ids)
+            if product_id and (project_name, product_id) not in self._product_versions
+        ]
+        if missing_ids:
+            fetched = self.api.get_product_versions(project_name, missing_ids)
+            for product_id, version_nodes in fetched.items():
+                for node in version_nodes:
+                    node['createdAt'] = standardize_date(node.get('createdAt', 'N/A'))
+                version_nodes.sort(key=lambda x: x.get('version', 0), reverse=True)
+                self._product_versions[(project_name, product_id)] = version_nodes
+
+        return {
+            product_id: self._product_versions.get((project_name, product_id), [])
+            for product_id in product_ids
+            if product_id
+        }
+
+    def clear_version_caches(self):
+        """Forget fetched product versions, representations and reviewables so they are fetched again."""
+        self._product_versions = {}
+        self._representations = {}
+        self._reviewables = {}
+
+    def get_rows_representations(self, project_name, rows):
+        """Return representations of each row's version.
+
+        Representations are not part of the row data. They are fetched on
+        demand in one batch for all versions not fetched before and memoized
+        per version until the next load or refresh.
+        """
+        version_ids = [row.get('version_id') for row in rows]
+        missing_ids = [
+            version_id for version_id in dict.fromkeys(version_ids)
+            if version_id and version_id != "N/A" and version_id not in self._representations
+        ]
+        if missing_ids:
+            self._representations.update(self.api.get_versions_representations(project_name, missing_ids))
+
+        return [self._representations.get(version_id, []) for version_id in version_ids]
+
+    def get_rows_reviewables(self, project_name, rows):
+        """Return reviewables of each row's version.
+
+        Versions not looked up before are fetched concurrently in one batch,
+        skipping rows known to have no reviewables. Results are memoized per
+        version until the next load or refresh.
+        """
+        version_ids = [row.get('version_id') for row in rows]
+        missing_ids = [
+            row.get('version_id') for row in rows
+            if row.get('hasReviewables') is not False and row.get('version_id') not in self._reviewables
+        ]
+        if missing_ids:
+            self._reviewables.update(self.api.get_versions_reviewables(project_name, missing_ids))
+
+        return [self._reviewables.get(version_id, []) for version_id in version_ids]
+
     def _process_version_data(self, version_node, all_product_versions):
         """Process version data and include all product versions."""
-        # Get thumbnail
-        if version_node.get("thumbnailId"):
-            thumbnail_data = self.api.get_version_thumbnail_data(self.current_project, version_node["id"])
-        else:
-            thumbnail_data = None
-
         task = version_node.get("task") or {}
         parents = version_node.get("parents") or []
 
-        # Process representations
-        try:
-            representations = [
-                node["node"]["attrib"]
-                for node in version_node.get("representations", {}).get("edges", [])
-                if node and node.get("node") and node["node"].get("attrib")
-            ]
-        except (KeyError, TypeError):
-            representations = []
-
-        # Create versions list with all product versions
-        versions_list = []
-        for v in sorted(all_product_versions, key=lambda x: x.get('version', 0), reverse=True):
-            version_name = f"v{v.get('version', 1):03d}"
-            versions_list.append(version_name)
+        # Create versions list with all product versions, already sorted latest first
+        versions_list = [f"v{v.get('version', 1):03d}" for v in all_product_versions]
 
         # If no versions found, use current version
         if not versions_list:
@@ -206,7 +509,7 @@ class DataService:
 
         current_version = f"v{version_node.get('version', 1):03d}"
 
-        return {
+        return VersionRow(**{
             "sequence_name": parents[1] if len(parents) > 1 else "N/A",
             "shot_name": parents[2] if len(parents) > 2 else "N/A",
             "task_name": task.get("name", "N/A"),
@@ -218,18 +521,17 @@ class DataService:
             "version_id": version_node.get("id", "N/A"),
             "reviewer_name": "N/A",
             "versions": versions_list,  # Now contains all product versions
-            "all_product_versions": all_product_versions,  # Store full version data
+            "all_product_versions": all_product_versions,  # Shared product versions index entry
             "current_version": current_version,
             "original_version": current_version,  # Track playlist's original version
             "product_id": version_node.get("productId", "N/A"),
             "product": version_node.get("product", {}).get("name", "N/A"),
             "version_status": version_node.get("status", "N/A"),
             "task_id": task.get("id", "N/A"),
-            "thumbnail_data": thumbnail_data,
-            "representations": representations,
+            "thumbnail_id": version_node.get("thumbnailId"),
             "path": version_node.get("path", "N/A"),
             "hasReviewables": version_node.get("hasReviewables")
-        }
+        })
 
 
 if __name__ == "__main__":
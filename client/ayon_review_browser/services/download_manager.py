@@ -0,0 +1,130 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+try:
+    from qtpy.QtCore import *
+except ImportError:
+    from PySide2.QtCore import *
+
+try:
+    from ..utils.rate_limiter import RateLimiter
+except ImportError:
+    from utils.rate_limiter import RateLimiter
+
+# Files downloaded at the same time
+DOWNLOAD_WORKERS = 4
+# Concurrent downloads allowed against a single host, below DOWNLOAD_WORKERS
+# so the AYON server, which serves every file, isn't hit by all workers at once
+DOWNLOADS_PER_HOST = 2
+# Minimum seconds between two aggregate progress signals
+PROGRESS_INTERVAL = 0.1
+
+
+class DownloadManager(QObject):
+    """Download many files concurrently on a worker pool.
+
+    Concurrency is bounded overall and per host, total bandwidth can be
+    capped and all downloads can be cancelled. Signals are emitted from
+    worker threads and delivered queued to receivers living in the UI
+    thread, e.g. a DownloadProgressDialog. `download_file` is called as
+    AyonClient.download_file and has to stop once its cancel event is set.
+    """
+    progress = Signal(str, int, int, object, object)  # filename, finished files, total files, bytes done, bytes total
+    file_finished = Signal(str, object)  # file_id, local path or None
+    finished = Signal(object)  # {file_id: local path or None}
+
+    def __init__(self, download_file, max_workers=DOWNLOAD_WORKERS, max_per_host=DOWNLOADS_PER_HOST,
+                 max_bytes_per_second=None, parent=None):
+        super().__init__(parent)
+        self._download_file = download_file
+        self._max_workers = max_workers
+        self._max_per_host = max_per_host
+        self._rate_limiter = RateLimiter(max_bytes_per_second) if max_bytes_per_second else None
+        self._host_slots = {}
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._executor = None
+
+    def download(self, project_name, files):
+        """Start downloading `files`, a list of (file_id, filename) tuples of a project."""
+        self.cancel()
+        self._cancel_event = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+
+        state = {
+            "total": len(files),
+            "finished": 0,
+            "results": {},
+            "bytes": {file_id: (0, None) for file_id, _ in files},
+            "last_emit": 0.0,
+        }
+        if not files:
+            self.finished.emit({})
+            return
+
+        # FileService streams every file from the AYON server
+        host = urlparse(os.environ.get("AYON_SERVER_URL", "")).netloc
+        for file_id, filename in files:
+            self._executor.submit(
+                self._run_download, project_name, file_id, filename, host, state, self._cancel_event
+            )
+        self._executor.shutdown(wait=False)
+
+    def cancel(self):
+        """Cancel running and queued downloads, partial files are kept for resuming."""
+        self._cancel_event.set()
+
+    def _get_host_slots(self, host):
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self._max_per_host)
+            return self._host_slots[host]
+
+    def _run_download(self, project_name, file_id, filename, host, state, cancel_event):
+        def on_progress(bytes_done, bytes_total):
+            # The download itself stops on the next chunk once cancel_event is set
+            if cancel_event.is_set():
+                return
+            with self._lock:
+                previous_done = state["bytes"][file_id][0]
+                state["bytes"][file_id] = (bytes_done, bytes_total)
+            if self._rate_limiter and not self._rate_limiter.consume(max(0, bytes_done - previous_done), cancel_event):
+                return
+            self._emit_progress(filename, state)
+
+        path = None
+        host_slots = self._get_host_slots(host)
+        with host_slots:
+            if not cancel_event.is_set():
+                try:
+                    path = self._download_file(project_name, file_id, filename, on_progress, cancel_event)
+                except Exception as e:
+                    print(f"Error downloading file {file_id}: {e}")
+                    path = None
+        if cancel_event.is_set():
+            path = None
+
+        with self._lock:
+            state["finished"] += 1
+            state["results"][file_id] = path
+            all_finished = state["finished"] == state["total"]
+        self.file_finished.emit(file_id, path)
+        self._emit_progress(filename, state, force=True)
+        if all_finished:
+            self.finished.emit(dict(state["results"]))
+
+    def _emit_progress(self, filename, state, force=False):
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - state["last_emit"] < PROGRESS_INTERVAL:
+                return
+            state["last_emit"] = now
+            finished = state["finished"]
+            bytes_done = sum(done for done, _ in state["bytes"].values())
+            totals = [total for _, total in state["bytes"].values()]
+            # The total is only known once every file reported its size
+            bytes_total = sum(totals) if all(totals) else None
+        self.progress.emit(filename, finished, state["total"], bytes_done, bytes_total)
@@ -0,0 +1,131 @@
+import threading
+
+try:
+    from qtpy.QtCore import *
+except ImportError:
+    from PySide2.QtCore import *
+
+try:
+    from .data_service import LoadCancelled
+except ImportError:
+    from services.data_service import LoadCancelled
+
+
+class _ProjectLoadSignals(QObject):
+    progress = Signal(int, str, int)  # job_id, message, percent
+    rows_loaded = Signal(int, object)  # job_id, page of review rows
+    finished = Signal(int, object)  # job_id, result
+    failed = Signal(int, str)  # job_id, error
+
+
+class _ProjectLoadJob(QRunnable):
+    def __init__(self, job_id, load_function, cancel_event, signals):
+        super().__init__()
+        self.job_id = job_id
+        self.load_function = load_function
+        self.cancel_event = cancel_event
+        self.signals = signals
+
+    def run(self):
+        try:
+            result = self.load_function(
+                progress_callback=lambda message, percent: self.signals.progress.emit(self.job_id, message, percent),
+                cancel_event=self.cancel_event,
+                rows_callback=lambda rows: self.signals.rows_loaded.emit(self.job_id, rows)
+            )
+        except LoadCancelled:
+            return
+        except Exception as e:
+            self.signals.failed.emit(self.job_id, str(e))
+            return
+
+        if not self.cancel_event.is_set():
+            self.signals.finished.emit(self.job_id, result)
+
+
+class ProjectLoader(QObject):
+    """Load project data on a worker thread without blocking the Qt event loop.
+
+    Starting a new load or refresh cancels the previous one; results and
+    progress of cancelled loads are never delivered.
+    """
+    progress = Signal(str, str, int)  # project_name, message, percent (-1 when unknown)
+    rows_loaded = Signal(str, object)  # project_name, page of review rows
+    loaded = Signal(str, object)  # project_name, result of DataService.load_project_data
+    refreshed = Signal(str, object)  # project_name, result of DataService.load_project_updates
+    failed = Signal(str, str)  # project_name, error
+
+    def __init__(self, data_service, parent=None):
+        super().__init__(parent)
+        self.data_service = data_service
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(2)
+        self._job_id = 0
+        self._project_name = None
+        self._cancel_event = None
+        self._finished_signal = None
+
+        self._signals = _ProjectLoadSignals(self)
+        self._signals.progress.connect(self._on_job_progress, Qt.QueuedConnection)
+        self._signals.rows_loaded.connect(self._on_job_rows_loaded, Qt.QueuedConnection)
+        self._signals.finished.connect(self._on_job_finished, Qt.QueuedConnection)
+        self._signals.failed.connect(self._on_job_failed, Qt.QueuedConnection)
+
+    def load(self, project_name):
+        """Start loading a project, aborting any load still running."""
+        def load_function(progress_callback, cancel_event, rows_callback):
+            return self.data_service.load_project_data(
+                project_name, progress_callback, cancel_event, rows_callback
+            )
+
+        self._start(project_name, load_function, self.loaded)
+
+    def refresh(self, project_name, known_version_ids):
+        """Start fetching changes of an already loaded project, aborting any load still running."""
+        known_version_ids = set(known_version_ids)
+
+        def load_function(progress_callback, cancel_event, rows_callback):
+            return self.data_service.load_project_updates(
+                project_name, known_version_ids, progress_callback, cancel_event
+            )
+
+        self._start(project_name, load_function, self.refreshed)
+
+    def _start(self, project_name, load_function, finished_signal):
+        self.cancel()
+        self._job_id += 1
+        self._project_name = project_name
+        self._finished_signal = finished_signal
+        self._cancel_event = threading.Event()
+        self._thread_pool.start(
+            _ProjectLoadJob(self._job_id, load_function, self._cancel_event, self._signals)
+        )
+
+    def cancel(self):
+        """Cancel the running load, if any."""
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+            self._cancel_event = None
+
+    def is_loading(self):
+        return self._cancel_event is not None
+
+    def _on_job_progress(self, job_id, message, percent):
+        if job_id == self._job_id and self._cancel_event is not None:
+            self.progress.emit(self._project_name, message, percent)
+
+    def _on_job_rows_loaded(self, job_id, rows):
+        if job_id == self._job_id and self._cancel_event is not None:
+            self.rows_loaded.emit(self._project_name, rows)
+
+    def _on_job_finished(self, job_id, result):
+        if job_id != self._job_id or self._cancel_event is None:
+            return
+        self._cancel_event = None
+        self._finished_signal.emit(self._project_name, result)
+
+    def _on_job_failed(self, job_id, error):
+        if job_id != self._job_id or self._cancel_event is None:
+            return
+        self._cancel_event = None
+        self.failed.emit(self._project_name, error)
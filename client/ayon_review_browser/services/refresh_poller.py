@@ -0,0 +1,108 @@
+try:
+    from qtpy.QtCore import *
+except ImportError:
+    from PySide2.QtCore import *
+
+# Checks run this many times less often while the browser window is hidden
+HIDDEN_INTERVAL_FACTOR = 10
+# Shortest polling interval in seconds, shorter configured intervals are raised to it
+MIN_INTERVAL = 15
+
+
+class _UpdateCheckSignals(QObject):
+    finished = Signal(int, bool)  # check_id, project has updates
+
+
+class _UpdateCheckJob(QRunnable):
+    def __init__(self, check_id, data_service, project_name, signals):
+        super().__init__()
+        self.check_id = check_id
+        self.data_service = data_service
+        self.project_name = project_name
+        self.signals = signals
+
+    def run(self):
+        try:
+            has_updates = self.data_service.has_project_updates(self.project_name)
+        except Exception as e:
+            print(f"Error checking project '{self.project_name}' for updates: {e}")
+            has_updates = False
+        self.signals.finished.emit(self.check_id, has_updates)
+
+
+class RefreshPoller(QObject):
+    """Periodically check the loaded project for changes on a worker thread.
+
+    A check only compares a small change summary of the project with the one
+    taken at its last sync; `updates_available` is emitted when they differ.
+    Polling is disabled while the interval is 0 and slowed down while
+    throttled, e.g. when the browser window is hidden.
+    """
+    updates_available = Signal(str)  # project_name
+
+    def __init__(self, data_service, parent=None):
+        super().__init__(parent)
+        self.data_service = data_service
+        self._project_name = None
+        self._interval = 0
+        self._throttled = False
+        self._check_id = 0
+        self._checking = False
+
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(1)
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.check_now)
+
+        self._signals = _UpdateCheckSignals(self)
+        self._signals.finished.connect(self._on_check_finished, Qt.QueuedConnection)
+
+    def set_project(self, project_name):
+        """Poll a different project, discarding checks still running for the previous one."""
+        project_name = project_name or None
+        if project_name != self._project_name:
+            self._project_name = project_name
+            self._check_id += 1
+            self._checking = False
+        self._update_timer()
+
+    def set_interval(self, seconds):
+        """Set the polling interval in seconds, at least MIN_INTERVAL; 0 disables polling."""
+        seconds = max(0, int(seconds or 0))
+        if seconds:
+            seconds = max(MIN_INTERVAL, seconds)
+        if seconds != self._interval:
+            self._interval = seconds
+            self._update_timer()
+
+    def set_throttled(self, throttled):
+        """Poll less often while throttled, checking right away when throttling ends."""
+        if throttled == self._throttled:
+            return
+        self._throttled = throttled
+        self._update_timer()
+        if not throttled and self._timer.isActive():
+            self.check_now()
+
+    def check_now(self):
+        """Start a check unless one is already running."""
+        if self._checking or not self._project_name:
+            return
+        self._checking = True
+        self._thread_pool.start(
+            _UpdateCheckJob(self._check_id, self.data_service, self._project_name, self._signals)
+        )
+
+    def _update_timer(self):
+        if not self._interval or not self._project_name:
+            self._timer.stop()
+            return
+        factor = HIDDEN_INTERVAL_FACTOR if self._throttled else 1
+        self._timer.start(self._interval * factor * 1000)
+
+    def _on_check_finished(self, check_id, has_updates):
+        if check_id != self._check_id:
+            return
+        self._checking = False
+        if has_updates:
+            self.updates_available.emit(self._project_name)
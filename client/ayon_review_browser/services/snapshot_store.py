@@ -0,0 +1,114 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+try:
+    from .version_row import VERSION_ROW_FIELDS, VersionRow
+except ImportError:
+    from services.version_row import VERSION_ROW_FIELDS, VersionRow
+
+# Bumped whenever the stored layout changes, older snapshots are ignored
+SNAPSHOT_FORMAT_VERSION = 1
+# Snapshots of projects opened least recently are dropped beyond this count
+SNAPSHOT_MAX_PROJECTS = 20
+
+
+class SnapshotStore:
+    """SQLite store with the last loaded review rows of each project.
+
+    Each project is one row holding a zlib compressed JSON document, rows are
+    stored as value lists in VERSION_ROW_FIELDS order. Reading a snapshot is
+    one indexed lookup, so a project can be shown before the server answers.
+    """
+
+    def __init__(self, db_path: str, max_projects: int = SNAPSHOT_MAX_PROJECTS) -> None:
+        self.db_path = db_path
+        self.max_projects = max_projects
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, timeout=5)
+        if not self._initialized:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "project_name TEXT PRIMARY KEY, "
+                "format_version INTEGER NOT NULL, "
+                "saved_at REAL NOT NULL, "
+                "data BLOB NOT NULL)"
+            )
+            self._initialized = True
+        return connection
+
+    def load(self, project_name: str) -> Optional[Dict[str, Any]]:
+        """Return {"rows", "metadata", "saved_at"} of a project, None when there is no usable snapshot."""
+        if not os.path.exists(self.db_path):
+            return None
+        try:
+            with self._lock:
+                connection = self._connect()
+                try:
+                    record = connection.execute(
+                        "SELECT format_version, saved_at, data FROM snapshots WHERE project_name = ?",
+                        (project_name,)
+                    ).fetchone()
+                finally:
+                    connection.close()
+            if not record or record[0] != SNAPSHOT_FORMAT_VERSION:
+                return None
+
+            document = json.loads(zlib.decompress(record[2]).decode("utf-8"))
+        except Exception as e:
+            print(f"Error reading snapshot of project '{project_name}': {e}")
+            return None
+
+        fields = document.get("fields") or []
+        rows = [
+            VersionRow(**{
+                field: value
+                for field, value in zip(fields, values)
+                if value is not None and field in VERSION_ROW_FIELDS
+            })
+            for values in document.get("rows") or []
+        ]
+        return {"rows": rows, "metadata": document.get("metadata") or {}, "saved_at": record[1]}
+
+    def save(self, project_name: str, rows: List[VersionRow], metadata: Dict[str, Any]) -> None:
+        """Replace the snapshot of a project."""
+        document = {
+            "fields": VERSION_ROW_FIELDS,
+            "rows": [[row.get(field) for field in VERSION_ROW_FIELDS] for row in rows],
+            "metadata": metadata,
+        }
+        data = zlib.compress(json.dumps(document, separators=(",", ":")).encode("utf-8"))
+
+        try:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            with self._lock:
+                connection = self._connect()
+                try:
+                    with connection:
+                        connection.execute(
+                            "INSERT OR REPLACE INTO snapshots (project_name, format_version, saved_at, data) "
+                            "VALUES (?, ?, ?, ?)",
+                            (project_name, SNAPSHOT_FORMAT_VERSION, time.time(), sqlite3.Binary(data))
+                        )
+                        connection.execute(
+                            "DELETE FROM snapshots WHERE project_name NOT IN "
+                            "(SELECT project_name FROM snapshots ORDER BY saved_at DESC LIMIT ?)",
+                            (self.max_projects,)
+                        )
+                finally:
+                    connection.close()
+        except Exception as e:
+            print(f"Error saving snapshot of project '{project_name}': {e}")
+
+    def save_async(self, project_name: str, rows: List[VersionRow], metadata: Dict[str, Any]) -> None:
+        """Save a snapshot on a background thread, keeping the caller responsive."""
+        self._executor.submit(self.save, project_name, list(rows), metadata)
@@ -0,0 +1,95 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+try:
+    from qtpy.QtCore import *
+except ImportError:
+    from PySide2.QtCore import *
+
+logger = logging.getLogger(__name__)
+
+
+class ThumbnailLoader(QObject):
+    """Fetch version thumbnails on a small background thread pool.
+
+    Requests are served most-recent first. Table models request thumbnails
+    while painting, so the rows currently visible in a view always jump to
+    the front of the queue. The queue is bounded; the stalest requests are
+    dropped and simply requested again once their rows are painted.
+    """
+
+    thumbnail_loaded = Signal(str, object)  # version_id, thumbnail bytes or None
+
+    def __init__(self, fetch_thumbnail: Callable[[str, str, Optional[str]], Optional[bytes]],
+                 max_workers: int = 4, max_pending: int = 256, parent=None):
+        super().__init__(parent)
+        self._fetch_thumbnail = fetch_thumbnail
+        self._max_pending = max_pending
+        self._project_name = None
+        self._pending = OrderedDict()  # version_id -> thumbnail_id
+        self._in_flight = set()
+        self._condition = threading.Condition()
+        self._stopped = False
+
+        self._workers = []
+        for index in range(max_workers):
+            worker = threading.Thread(
+                target=self._worker_loop, name=f"ThumbnailLoader-{index}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def set_project(self, project_name: Optional[str]):
+        """Switch project and drop every request queued for the previous one."""
+        with self._condition:
+            self._project_name = project_name
+            self._pending.clear()
+
+    def request(self, version_id: str, thumbnail_id: Optional[str] = None):
+        """Queue a thumbnail fetch, moving it to the front if already queued."""
+        if not version_id or version_id == "N/A":
+            return
+
+        with self._condition:
+            if not self._project_name or version_id in self._in_flight:
+                return
+            if version_id in self._pending:
+                self._pending.move_to_end(version_id)
+            else:
+                self._pending[version_id] = thumbnail_id
+                while len(self._pending) > self._max_pending:
+                    self._pending.popitem(last=False)
+            self._condition.notify()
+
+    def shutdown(self):
+        """Stop worker threads once their current fetch finishes."""
+        with self._condition:
+            self._stopped = True
+            self._pending.clear()
+            self._condition.notify_all()
+
+    def _worker_loop(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                version_id, thumbnail_id = self._pending.popitem(last=True)
+                project_name = self._project_name
+                self._in_flight.add(version_id)
+
+            try:
+                thumbnail_data = self._fetch_thumbnail(project_name, version_id, thumbnail_id)
+            except Exception as e:
+                logger.error(f"Error loading thumbnail for version {version_id}: {e}")
+                thumbnail_data = None
+
+            with self._condition:
+                self._in_flight.discard(version_id)
+                if project_name != self._project_name:
+                    continue
+
+            self.thumbnail_loaded.emit(version_id, thumbnail_data)
@@ -0,0 +1,105 @@
+import sys
+from typing import Any, Dict, Iterator, Optional
+
+# Fields of review submission rows and list rows
+VERSION_ROW_FIELDS = (
+    "sequence_name",
+    "shot_name",
+    "task_name",
+    "task_type",
+    "task_status",
+    "author",
+    "submission_type",
+    "submitted_at",
+    "created_at",
+    "version_id",
+    "reviewer_name",
+    "versions",
+    "all_product_versions",
+    "current_version",
+    "original_version",
+    "product_id",
+    "product",
+    "version_status",
+    "task_id",
+    "thumbnail_id",
+    "path",
+    "hasReviewables",
+)
+
+# Low-cardinality values repeated across many rows share one string object
+INTERNED_FIELDS = frozenset((
+    "sequence_name",
+    "task_name",
+    "task_type",
+    "task_status",
+    "author",
+    "submission_type",
+    "reviewer_name",
+    "product",
+    "version_status",
+))
+
+_FIELD_SET = frozenset(VERSION_ROW_FIELDS)
+
+
+class VersionRow:
+    """Compact record holding a single version table row.
+
+    Implements the part of the dict interface used by the table models,
+    filter strategies and dialogs (`get`, item access, `in`), so rows can be
+    passed wherever a row dictionary was expected. Fields that were never
+    set behave like missing dictionary keys.
+    """
+
+    __slots__ = VERSION_ROW_FIELDS
+
+    def __init__(self, **fields: Any) -> None:
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VersionRow":
+        return cls(**{key: value for key, value in data.items() if key in _FIELD_SET})
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        if key in INTERNED_FIELDS and isinstance(value, str):
+            value = sys.intern(value)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _FIELD_SET and hasattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def keys(self) -> Iterator[str]:
+        return (key for key in VERSION_ROW_FIELDS if hasattr(self, key))
+
+    def items(self) -> Iterator:
+        return ((key, getattr(self, key)) for key in self.keys())
+
+    def copy(self) -> "VersionRow":
+        """Return a shallow copy of the row."""
+        return VersionRow(**self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"VersionRow({self.to_dict()!r})"
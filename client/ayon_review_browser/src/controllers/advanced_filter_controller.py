@@ -25,6 +25,7 @@ class AdvancedFilterController(QObject):
     """Modular advanced filter controller using filter strategies."""
     filters_changed = Signal(int, dict)  # tab_index, filters
     project_changed = Signal(str)
+    refresh_requested = Signal(str)  # project_name
 
     def __init__(self, filters_layout=None, tool_button=None):
         super().__init__()
@@ -198,6 +199,6 @@ class AdvancedFilterController(QObject):
         self.list_filter_controller.set_authors(authors)
 
     def refresh_data(self):
-        """Refresh data - functionality matches original."""
+        """Request a refresh of the current project's data."""
         current_project = self.get_current_project()
-        self.project_changed.emit(current_project)
\ No newline at end of file
+        self.refresh_requested.emit(current_project)
\ No newline at end of file
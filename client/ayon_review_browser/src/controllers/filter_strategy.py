@@ -1,12 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional
 
 try:
     from ..views.widgets.standalone_search_bar import FilterDefinition
-    from ...utils.date_utils import filter_by_date_simple
+    from ...utils.date_utils import get_date_range, matches_date_range
 except ImportError:
     from src.views.widgets.standalone_search_bar import FilterDefinition
-    from utils.date_utils import filter_by_date_simple
+    from utils.date_utils import get_date_range, matches_date_range
 
 
 class FilterStrategy(ABC):
@@ -15,6 +15,7 @@ class FilterStrategy(ABC):
     def __init__(self):
         self._status_items = [{"value": "All"}]
         self._task_type_items = [{"value": "All"}]
+        self._searchable_fields = None
 
     @abstractmethod
     def get_filter_definitions(self) -> List[FilterDefinition]:
@@ -22,15 +23,51 @@ class FilterStrategy(ABC):
         pass
 
     @abstractmethod
-    def apply_filters(self, data: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Apply filters to data and return filtered results."""
+    def get_searchable_fields(self) -> List[str]:
+        """Return list of fields that can be searched."""
         pass
 
     @abstractmethod
-    def get_searchable_fields(self) -> List[str]:
-        """Return list of fields that can be searched."""
+    def _matches_filters(self, item: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        """Check a single row against all filters except search and date."""
         pass
 
+    def build_search_text(self, item: Dict[str, Any]) -> str:
+        """Return lowercase text of all searchable fields of a row."""
+        if self._searchable_fields is None:
+            self._searchable_fields = tuple(self.get_searchable_fields())
+        return "\n".join(str(item.get(field, '')).lower() for field in self._searchable_fields)
+
+    def build_predicate(self, filters: Dict[str, Any]) -> Callable[..., bool]:
+        """Return a function testing whether a single row passes the filters.
+
+        The function accepts the row and optionally its precomputed
+        `build_search_text` result, which spares rebuilding it per keystroke.
+        """
+        search = filters.get('search', '').lower()
+        date_filter = filters.get('date')
+        date_range = None
+        if date_filter and date_filter not in ['All', 'ALL']:
+            date_range = get_date_range(date_filter)
+
+        def predicate(item: Dict[str, Any], search_text: Optional[str] = None) -> bool:
+            if search:
+                if search_text is None:
+                    search_text = self.build_search_text(item)
+                if search not in search_text:
+                    return False
+            return matches_date_range(item, date_range) and self._matches_filters(item, filters)
+
+        return predicate
+
+    def apply_filters(self, data: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Apply filters to data and return filtered results."""
+        if not data:
+            return data
+
+        predicate = self.build_predicate(filters)
+        return [item for item in data if predicate(item)]
+
     def set_status_items(self, status_items: List[Dict[str, str]]):
         """Update status filter items dynamically."""
         self._status_items = status_items
@@ -108,31 +145,7 @@ class ReviewTableFilterStrategy(FilterStrategy):
             'current_version', 'version_status', 'author', 'submitted_at', 'reviewer_name'
         ]
 
-    def apply_filters(self, data: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        if not data:
-            return data
-
-        # Apply date filter first
-        date_filter = filters.get('date')
-        if date_filter and date_filter not in ['All', 'ALL']:
-            data = filter_by_date_simple(data, date_filter)
-
-        # Apply other filters
-        filtered_data = []
-        for item in data:
-            if self._matches_filters(item, filters):
-                filtered_data.append(item)
-
-        return filtered_data
-
     def _matches_filters(self, item: Dict[str, Any], filters: Dict[str, Any]) -> bool:
-        # Search filter
-        search_text = filters.get('search', '').lower()
-        if search_text:
-            searchable_fields = [str(item.get(field, '')) for field in self.get_searchable_fields()]
-            if not any(search_text in field.lower() for field in searchable_fields):
-                return False
-
         # Submission Type filter
         submission_type_filter = filters.get('submission_type')
         if submission_type_filter:
@@ -232,31 +245,7 @@ class ListTableFilterStrategy(FilterStrategy):
             'current_version', 'version_status', 'author', 'created_at'
         ]
 
-    def apply_filters(self, data: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-        if not data:
-            return data
-
-        # Apply date filter first
-        date_filter = filters.get('date')
-        if date_filter and date_filter != 'ALL':
-            data = filter_by_date_simple(data, date_filter)
-
-        # Apply other filters
-        filtered_data = []
-        for item in data:
-            if self._matches_filters(item, filters):
-                filtered_data.append(item)
-
-        return filtered_data
-
     def _matches_filters(self, item: Dict[str, Any], filters: Dict[str, Any]) -> bool:
-        # Search filter
-        search_text = filters.get('search', '').lower()
-        if search_text:
-            searchable_fields = [str(item.get(field, '')) for field in self.get_searchable_fields()]
-            if not any(search_text in field.lower() for field in searchable_fields):
-                return False
-
         # Status filter - Multi-selection support
         status_filter = filters.get('status')
         if status_filter:
@@ -12,9 +12,11 @@ except ImportError:
 try:
     # Try relative imports first (when imported as part of package)
     from ...icons.icons import Icons
+    from .table_manager import resize_columns_to_contents
 except ImportError:
     # Fall back to absolute imports (when run directly)
     from icons.icons import Icons
+    from src.managers.table_manager import resize_columns_to_contents
 
 
 class PreferencesManager:
@@ -204,8 +206,8 @@ class PreferencesManager:
         for col in range(self.main_window.list_model.columnCount()):
             self.main_window.tableView_list_versions.showColumn(col)
 
-        self.main_window.tableView_review_versions.resizeColumnsToContents()
-        self.main_window.tableView_list_versions.resizeColumnsToContents()
+        resize_columns_to_contents(self.main_window.tableView_review_versions)
+        resize_columns_to_contents(self.main_window.tableView_list_versions)
 
     def _add_row_height_control(self, menu):
         """Add row height slider to menu."""
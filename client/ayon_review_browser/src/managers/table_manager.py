@@ -23,13 +23,32 @@ def exec_menu(menu, pos):
         raise AttributeError("QMenu has neither exec nor exec_")
 
 
+def resize_columns_to_contents(table_view):
+    """Resize columns of a table view to their contents, except the Thumbnail column.
+
+    Measuring the Thumbnail column would request the thumbnail of every
+    sampled row, including rows far off screen, so it is given the row
+    height as width instead.
+    """
+    model = table_view.model()
+    if model is None:
+        return
+    for column in range(model.columnCount()):
+        if model.headerData(column, Qt.Horizontal, Qt.DisplayRole) == "Thumbnail":
+            table_view.setColumnWidth(column, table_view.verticalHeader().defaultSectionSize())
+        else:
+            table_view.resizeColumnToContents(column)
+
+
 class TableManager:
     def __init__(self, main_window):
         self.main_window = main_window
 
     def setup_tables(self):
         """Setup table configurations and delegates."""
-        # Enable sorting
+        # Enable sorting, keeping the loaded order until a column header is clicked
+        self.main_window.tableView_review_versions.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.main_window.tableView_list_versions.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
         self.main_window.tableView_review_versions.setSortingEnabled(True)
         self.main_window.tableView_list_versions.setSortingEnabled(True)
 
@@ -98,22 +117,24 @@ class TableManager:
             import rv.commands as rv_cmd
 
             # Get selected rows
-            selected_rows = [idx.row() for idx in table_view.selectionModel().selectedRows()]
+            selected_rows = table_view.selectionModel().selectedRows()
             if not selected_rows:
                 QMessageBox.warning(self.main_window, "Warning", "No rows selected")
                 return
 
             model = table_view.model()
 
+            # Resolve representations of all selected rows in one batch
+            rows = [model.row_data(index) for index in selected_rows]
+            data_service = self.main_window.data_service
+            rows_representations = data_service.get_rows_representations(data_service.current_project, rows)
+
             # Clear RV session
             rv_cmd.clearSession()
 
             # Load each version
             loaded_count = 0
-            for row in selected_rows:
-                row_data = model._data[row]
-                representations = row_data.get('representations', [])
-
+            for representations in rows_representations:
                 # Find best representation (prefer exr, then mov/mp4)
                 path = None
                 for rep in representations:
@@ -186,19 +207,4 @@ class TableManager:
             table_view.showColumn(column)
         else:
             table_view.hideColumn(column)
-        table_view.resizeColumnsToContents()
-
-    def open_persistent_editors(self):
-        """Open persistent editors for Version column."""
-        review_version_col = self.main_window.review_model.COLUMNS.index("Version")
-        list_version_col = self.main_window.list_model.COLUMNS.index("Version")
-
-        # Open persistent editors for review table
-        for row in range(self.main_window.review_model.rowCount()):
-            index = self.main_window.review_model.index(row, review_version_col)
-            self.main_window.tableView_review_versions.openPersistentEditor(index)
-
-        # Open persistent editors for list table
-        for row in range(self.main_window.list_model.rowCount()):
-            index = self.main_window.list_model.index(row, list_version_col)
-            self.main_window.tableView_list_versions.openPersistentEditor(index)
+        resize_columns_to_contents(table_view)
@@ -1,3 +1,3 @@
 from .table_models import *
 
-__all__ = ['VersionTableModel', 'ReviewTableModel', 'ListTableModel', 'ComboBoxDelegate']
\ No newline at end of file
+__all__ = ['VersionTableModel', 'ReviewTableModel', 'ListTableModel', 'VersionFilterProxyModel', 'ComboBoxDelegate']
\ No newline at end of file
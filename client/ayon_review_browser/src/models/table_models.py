@@ -19,7 +19,7 @@ REVIEW_HEADER_TO_KEY = {
     "Submitter Name": "author",
     "Reviewer Name": "reviewer_name",
     "Date": "submitted_at",
-    "Thumbnail": "thumbnail_data",
+    "Thumbnail": "thumbnail_id",
     "Path": "path"
 }
 
@@ -33,26 +33,36 @@ LIST_HEADER_TO_KEY = {
     "Status": "version_status",
     "Author": "author",
     "Created At": "created_at",
-    "Thumbnail": "thumbnail_data",
+    "Thumbnail": "thumbnail_id",
     "Path": "path"
 }
 
 
 class ComboBoxDelegate(QStyledItemDelegate):
+    """Version selector painted as a combo box.
+
+    A real QComboBox is only created for the cell being edited, when it is
+    clicked, so the number of widgets doesn't grow with the row count.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
     def createEditor(self, parent, option, index):
         combo = QComboBox(parent)
-        model = index.model()
-        row_data = model._data[index.row()]
+        row_data = index.model().row_data(index)
         combo.addItems(row_data.get('versions', []))
-        combo.currentTextChanged.connect(lambda text: self.commitData.emit(combo))
+        combo.activated.connect(lambda _: self._commit_and_close(combo))
+        # The cell already looks like a combo box, open the popup right away
+        QTimer.singleShot(0, combo.showPopup)
         return combo
 
+    def _commit_and_close(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor, QAbstractItemDelegate.NoHint)
+
     def setEditorData(self, editor, index):
-        model = index.model()
-        row_data = model._data[index.row()]
+        row_data = index.model().row_data(index)
         current_version = row_data.get('current_version', '')
         editor.setCurrentText(current_version)
 
@@ -60,31 +70,80 @@ class ComboBoxDelegate(QStyledItemDelegate):
         selected_version = editor.currentText()
         model.setData(index, selected_version, Qt.EditRole)
 
+    def editorEvent(self, event, model, option, index):
+        # Open the editor on a single click instead of the view's edit triggers
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and index.flags() & Qt.ItemIsEditable and option.widget is not None):
+            option.widget.edit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
     def paint(self, painter, option, index):
-        # Don't paint anything when persistent editor is open
-        # This prevents text overlap like in AYON
-        pass
+        style = option.widget.style() if option.widget else QApplication.style()
+
+        # Row background and selection, without the text
+        item_option = QStyleOptionViewItem(option)
+        self.initStyleOption(item_option, index)
+        item_option.text = ""
+        style.drawControl(QStyle.CE_ItemViewItem, item_option, painter, option.widget)
+
+        combo_option = self._combo_option(option, index)
+        style.drawComplexControl(QStyle.CC_ComboBox, combo_option, painter, option.widget)
+        style.drawControl(QStyle.CE_ComboBoxLabel, combo_option, painter, option.widget)
 
     def sizeHint(self, option, index):
-        return QComboBox().sizeHint()
+        style = option.widget.style() if option.widget else QApplication.style()
+        combo_option = self._combo_option(option, index)
+        text_size = option.fontMetrics.size(Qt.TextSingleLine, combo_option.currentText)
+        return style.sizeFromContents(QStyle.CT_ComboBox, combo_option, text_size, option.widget)
+
+    @staticmethod
+    def _combo_option(option, index):
+        """Build the style option of a combo box showing the cell's version."""
+        combo_option = QStyleOptionComboBox()
+        combo_option.rect = option.rect.adjusted(1, 1, -1, -1)
+        combo_option.state = option.state | QStyle.State_Enabled
+        combo_option.palette = option.palette
+        combo_option.fontMetrics = option.fontMetrics
+        combo_option.currentText = index.data(Qt.DisplayRole) or ""
+        return combo_option
 
 
 class VersionTableModel(QAbstractTableModel):
-    version_changed = Signal(dict, str)
-    sorting_started = Signal()  # Signal to clear activity panel on sort
+    version_changed = Signal(object, str)
 
     def __init__(self, data=None, columns=None, header_mapping=None):
         super().__init__()
-        self._data = data or []
+        self._data = list(data) if data else []
         self.COLUMNS = columns
         self.header_mapping = header_mapping
         self._table_view = None
+        self._thumbnail_loader = None
+        self._thumbnails = {}  # version_id -> thumbnail bytes (None when unavailable)
+        self._pixmap_cache = {}  # version_id -> decoded pixmap scaled to _pixmap_cache_size
+        self._pixmap_cache_size = None
+        self._rows_by_version_id = None  # version_id -> row numbers, built on demand
 
     def set_table_view(self, table_view):
         """Set reference to table view for dynamic sizing."""
         self._table_view = table_view
         table_view.setAlternatingRowColors(True)
 
+    def set_thumbnail_loader(self, thumbnail_loader):
+        """Set background loader used to fetch thumbnails on demand."""
+        self._thumbnail_loader = thumbnail_loader
+        thumbnail_loader.thumbnail_loaded.connect(self._on_thumbnail_loaded, Qt.QueuedConnection)
+
+    def clear_thumbnails(self):
+        """Forget loaded thumbnails, e.g. when switching projects."""
+        self._thumbnails = {}
+        self._pixmap_cache = {}
+
+    def _forget_thumbnail(self, version_id):
+        """Drop the loaded thumbnail of a version so it is fetched again."""
+        self._thumbnails.pop(version_id, None)
+        self._pixmap_cache.pop(version_id, None)
+
     def rowCount(self, parent=None):
         return len(self._data)
 
@@ -103,18 +162,7 @@ class VersionTableModel(QAbstractTableModel):
                 return QColor(80, 60, 40)  # Subtle dark orange/amber
 
         if col_name == "Thumbnail" and role == Qt.DecorationRole:
-            thumbnail_data = row.get('thumbnail_data')
-            if thumbnail_data:
-                pixmap = QPixmap()
-                if pixmap.loadFromData(thumbnail_data):
-                    # Get current row height from table view
-                    size = self._get_thumbnail_size()
-                    try:
-                        return pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    except AttributeError:
-                        return pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
-                                             Qt.TransformationMode.SmoothTransformation)
-            return None
+            return self._get_thumbnail_pixmap(row)
 
         if role == Qt.DisplayRole and col_name != "Thumbnail":
             field_key = self.header_mapping.get(col_name, col_name.lower().replace(" ", "_"))
@@ -130,6 +178,64 @@ class VersionTableModel(QAbstractTableModel):
             return str(row.get(field_key, ""))
         return None
 
+    def _get_thumbnail_pixmap(self, row):
+        """Return the row's thumbnail decoded and scaled to the current row height."""
+        size = self._get_thumbnail_size()
+        if size != self._pixmap_cache_size:
+            self._pixmap_cache = {}
+            self._pixmap_cache_size = size
+
+        version_id = row.get('version_id')
+        if version_id in self._pixmap_cache:
+            return self._pixmap_cache[version_id]
+
+        thumbnail_data = self._get_thumbnail_data(row)
+        if not thumbnail_data:
+            return None
+
+        scaled_pixmap = None
+        pixmap = QPixmap()
+        if pixmap.loadFromData(thumbnail_data):
+            try:
+                scaled_pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            except AttributeError:
+                scaled_pixmap = pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                              Qt.TransformationMode.SmoothTransformation)
+        # Undecodable data is cached as None so it is not decoded again on every repaint
+        self._pixmap_cache[version_id] = scaled_pixmap
+        return scaled_pixmap
+
+    def _get_thumbnail_data(self, row):
+        """Return cached thumbnail bytes, requesting them from the loader if missing."""
+        version_id = row.get('version_id')
+        if version_id in self._thumbnails:
+            return self._thumbnails[version_id]
+
+        if self._thumbnail_loader and row.get('thumbnail_id'):
+            self._thumbnail_loader.request(version_id, row.get('thumbnail_id'))
+        return None
+
+    def _on_thumbnail_loaded(self, version_id, thumbnail_data):
+        """Store loaded thumbnail and repaint the Thumbnail cells showing it."""
+        self._thumbnails[version_id] = thumbnail_data
+        self._pixmap_cache.pop(version_id, None)
+        if not thumbnail_data or "Thumbnail" not in self.COLUMNS:
+            return
+
+        thumbnail_col = self.COLUMNS.index("Thumbnail")
+        for row_index in self._get_rows_by_version_id().get(version_id, ()):
+            index = self.index(row_index, thumbnail_col)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def _get_rows_by_version_id(self):
+        """Return the version id to row numbers map, rebuilding it after row changes."""
+        if self._rows_by_version_id is None:
+            rows_by_version_id = {}
+            for row_index, row in enumerate(self._data):
+                rows_by_version_id.setdefault(row.get('version_id'), []).append(row_index)
+            self._rows_by_version_id = rows_by_version_id
+        return self._rows_by_version_id
+
     def _get_thumbnail_size(self):
         """Get thumbnail size based on current row height."""
         if hasattr(self, '_table_view') and self._table_view:
@@ -142,6 +248,7 @@ class VersionTableModel(QAbstractTableModel):
             row = index.row()
             old_version = self._data[row].get('current_version', '')
             if value != old_version:
+                self._rows_by_version_id = None
                 self._data[row]['current_version'] = value
 
                 # Update row data from selected version in all_product_versions
@@ -156,6 +263,8 @@ class VersionTableModel(QAbstractTableModel):
                         self._data[row]['author'] = v.get('author', 'N/A')
                         self._data[row]['version_status'] = v.get('status', 'N/A')
                         self._data[row]['version_id'] = v.get('id', 'N/A')
+                        self._data[row]['thumbnail_id'] = v.get('thumbnailId')
+                        self._data[row]['hasReviewables'] = v.get('hasReviewables')
                         break
 
                 # Emit signals to update UI and notify listeners
@@ -174,69 +283,259 @@ class VersionTableModel(QAbstractTableModel):
             return self.COLUMNS[section]
         return None
 
-    def sort(self, column, order):
-        self.sorting_started.emit()  # Clear activity panel
-        self.layoutAboutToBeChanged.emit()
+    def row_data(self, index):
+        """Return the row record for a model index."""
+        return self._data[index.row()]
+
+    def _make_sort_key(self, column):
+        """Build a function returning a row's typed sort key for a column.
+
+        Versions sort by number, dates by their standardized
+        "YYYY-MM-DD HH:MM" text (chronological) and other columns by
+        lowercase text. Keys are meant to be computed once per row.
+        """
         col_name = self.COLUMNS[column]
         field_key = self.header_mapping.get(col_name, col_name.lower().replace(" ", "_"))
-        reverse = order == Qt.DescendingOrder
-        
-        # Store persistent model indexes before sort
-        persistent_indexes = self.persistentIndexList()
-        old_positions = {id(self._data[idx.row()]): idx.row() for idx in persistent_indexes}
 
-        def sort_key(x):
-            value = x.get(field_key, "")
-            
-            # Handle version lists - extract numeric value
-            if field_key == "versions" and isinstance(value, list):
-                v = value[0] if value else "v000"
-                try:
-                    return int(v.replace('v', '')) if v.startswith('v') else 0
-                except:
-                    return 0
-            # Handle current_version field (single version string)
-            elif field_key == "current_version":
+        if col_name == "Version":
+            def sort_key(x):
+                # Same value the Version cell displays
+                value = x.get('current_version', '')
                 if not value:
                     versions = x.get('versions', [])
                     value = versions[0] if versions else "v000"
                 try:
-                    return int(value.replace('v', '')) if value.startswith('v') else 0
-                except:
+                    return int(value[1:]) if value.startswith('v') else 0
+                except (TypeError, ValueError):
                     return 0
-            # Handle date fields
-            elif field_key in ["created_at", "submitted_at"]:
+        elif field_key in ("created_at", "submitted_at"):
+            def sort_key(x):
+                value = x.get(field_key, "")
                 if value == "N/A" or not value:
                     return "0000-00-00"
                 return value
-            # Case-insensitive string sorting
-            return str(value).lower()
-
-        self._data.sort(key=sort_key, reverse=reverse)
-        
-        # Update persistent indexes after sort
-        new_indexes = []
-        for idx in persistent_indexes:
-            row_id = id(self._data[old_positions.get(id(self._data[idx.row()]), idx.row())])
-            new_row = next((i for i, row in enumerate(self._data) if id(row) == row_id), idx.row())
-            new_indexes.append(self.index(new_row, idx.column()))
-        
-        self.changePersistentIndexList(persistent_indexes, new_indexes)
-        self.layoutChanged.emit()
+        else:
+            def sort_key(x):
+                # Case-insensitive string sorting
+                return str(x.get(field_key, "")).lower()
+
+        return sort_key
+
+    @staticmethod
+    def _row_key(row):
+        """Identity of a row used to match old and new rows in update_data."""
+        return row.get('version_id')
 
     def update_data(self, data):
-        self.beginResetModel()
-        self._data = data
-        self.endResetModel()
-        # Signal that persistent editors need to be reopened
+        """Replace rows, emitting only the row removals, inserts and changes needed.
+
+        Rows are matched by `_row_key`. Rows that stay keep their persistent
+        indexes, so selection, scroll position and open editors survive
+        reloads. Falls back to a model reset when row keys are not unique.
+        """
+        data = list(data)
+        self._rows_by_version_id = None
+        old_keys = [self._row_key(row) for row in self._data]
+        new_keys = [self._row_key(row) for row in data]
+        if len(set(old_keys)) != len(old_keys) or len(set(new_keys)) != len(new_keys):
+            self.beginResetModel()
+            self._data = data
+            self.endResetModel()
+            return
+
+        # Remove rows missing from new data, bottom-up in contiguous ranges
+        new_key_set = set(new_keys)
+        row = len(old_keys) - 1
+        while row >= 0:
+            if old_keys[row] in new_key_set:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and old_keys[row] not in new_key_set:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._data[row + 1:last + 1]
+            del old_keys[row + 1:last + 1]
+            self.endRemoveRows()
+
+        # Kept rows normally keep their relative order, reorder them otherwise
+        kept_keys = set(old_keys)
+        kept_order = [key for key in new_keys if key in kept_keys]
+        if kept_order != old_keys:
+            self._reorder_rows(kept_order)
+
+        # Insert new rows in contiguous ranges, top-down
+        row = 0
+        while row < len(new_keys):
+            if new_keys[row] in kept_keys:
+                row += 1
+                continue
+            first = row
+            while row < len(new_keys) and new_keys[row] not in kept_keys:
+                row += 1
+            self.beginInsertRows(QModelIndex(), first, row - 1)
+            self._data[first:first] = data[first:row]
+            self.endInsertRows()
+
+        # Swap in new row objects for kept rows and repaint only those
+        changed_rows = []
+        for row, row_data in enumerate(data):
+            old_row = self._data[row]
+            if old_row is not row_data:
+                if old_row.get('thumbnail_id') != row_data.get('thumbnail_id'):
+                    self._forget_thumbnail(row_data.get('version_id'))
+                self._data[row] = row_data
+                changed_rows.append(row)
+        self._emit_rows_changed(changed_rows)
+
+    def append_rows(self, rows):
+        """Append rows at the end of the table."""
+        if not rows:
+            return
+        first = len(self._data)
+        self._rows_by_version_id = None
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._data.extend(rows)
+        self.endInsertRows()
+
+    def _reorder_rows(self, keys):
+        """Reorder rows to match keys, remapping persistent indexes."""
+        self.layoutAboutToBeChanged.emit()
+        rows_by_key = {self._row_key(row): row for row in self._data}
+        new_positions = {key: position for position, key in enumerate(keys)}
+
+        persistent_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.index(new_positions[self._row_key(self._data[idx.row()])], idx.column())
+            for idx in persistent_indexes
+        ]
+
+        self._data = [rows_by_key[key] for key in keys]
+        self.changePersistentIndexList(persistent_indexes, new_indexes)
         self.layoutChanged.emit()
 
+    def _emit_rows_changed(self, rows):
+        """Emit dataChanged for each contiguous range of rows."""
+        last_column = self.columnCount() - 1
+        start = None
+        for position, row in enumerate(rows):
+            if start is None:
+                start = row
+            if position + 1 == len(rows) or rows[position + 1] != row + 1:
+                self.dataChanged.emit(self.index(start, 0), self.index(row, last_column))
+                start = None
+
 
 class ReviewTableModel(VersionTableModel):
     def __init__(self, data=None):
         super().__init__(data, list(REVIEW_HEADER_TO_KEY.keys()), REVIEW_HEADER_TO_KEY)
 
+    @staticmethod
+    def _row_key(row):
+        """Review rows are submissions, one per task; several may share a version or have none."""
+        return row.get('task_id')
+
 
 class ListTableModel(VersionTableModel):
     def __init__(self, data=None):
         super().__init__(data, list(LIST_HEADER_TO_KEY.keys()), LIST_HEADER_TO_KEY)
+
+
+class VersionFilterProxyModel(QSortFilterProxyModel):
+    """Filters and sorts a version table model without touching its rows.
+
+    The source model keeps every row; a filter change only re-evaluates
+    the active filter strategy's predicate through invalidateFilter().
+    Sort keys are computed once per row and column and reused until the
+    source rows change, so comparisons are plain list lookups.
+    """
+    sorting_started = Signal()  # Signal to clear activity panel on sort
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._strategy = None
+        self._filters = {}
+        self._predicate = None
+        self._search_texts = {}  # source row -> lowercase searchable text
+        self._sort_keys = {}  # column -> typed sort key of every source row
+
+    def setSourceModel(self, source_model):
+        previous_model = self.sourceModel()
+        if previous_model is not None:
+            for signal in (previous_model.modelReset, previous_model.layoutChanged,
+                           previous_model.rowsInserted, previous_model.rowsRemoved):
+                signal.disconnect(self._clear_row_caches)
+            previous_model.dataChanged.disconnect(self._on_source_data_changed)
+
+        # Connected before the proxy's own handlers so stale search texts and
+        # sort keys are dropped before changed rows get re-filtered and re-sorted
+        for signal in (source_model.modelReset, source_model.layoutChanged,
+                       source_model.rowsInserted, source_model.rowsRemoved):
+            signal.connect(self._clear_row_caches)
+        source_model.dataChanged.connect(self._on_source_data_changed)
+
+        self._clear_row_caches()
+        super().setSourceModel(source_model)
+
+    def set_strategy(self, strategy):
+        """Set filter strategy providing the row predicate."""
+        self._strategy = strategy
+        self._search_texts = {}
+        self.set_filters(self._filters)
+
+    def set_filters(self, filters):
+        """Apply new filter values and re-filter rows."""
+        self._filters = dict(filters or {})
+        self._predicate = self._strategy.build_predicate(self._filters) if self._strategy else None
+        self.invalidateFilter()
+
+    def row_data(self, index):
+        """Return the source row record for a proxy index."""
+        return self.sourceModel().row_data(self.mapToSource(index))
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._predicate is None:
+            return True
+
+        row = self.sourceModel()._data[source_row]
+        if not self._filters.get('search'):
+            return self._predicate(row)
+
+        search_text = self._search_texts.get(source_row)
+        if search_text is None:
+            search_text = self._strategy.build_search_text(row)
+            self._search_texts[source_row] = search_text
+        return self._predicate(row, search_text)
+
+    def _clear_row_caches(self, *args):
+        self._search_texts = {}
+        self._sort_keys = {}
+
+    def _on_source_data_changed(self, top_left, bottom_right, roles=None):
+        # Thumbnails and other decoration changes don't affect sorting or search
+        if roles and Qt.DisplayRole not in roles and Qt.EditRole not in roles:
+            return
+        source_data = self.sourceModel()._data
+        for column, sort_keys in self._sort_keys.items():
+            sort_key = self.sourceModel()._make_sort_key(column)
+            for source_row in range(top_left.row(), bottom_right.row() + 1):
+                sort_keys[source_row] = sort_key(source_data[source_row])
+        for source_row in range(top_left.row(), bottom_right.row() + 1):
+            self._search_texts.pop(source_row, None)
+
+    def _get_sort_keys(self, column):
+        """Return typed sort keys of all source rows for a column, computing them once."""
+        sort_keys = self._sort_keys.get(column)
+        if sort_keys is None:
+            sort_key = self.sourceModel()._make_sort_key(column)
+            sort_keys = [sort_key(row) for row in self.sourceModel()._data]
+            self._sort_keys[column] = sort_keys
+        return sort_keys
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sorting_started.emit()
+        super().sort(column, order)
+
+    def lessThan(self, left, right):
+        sort_keys = self._get_sort_keys(left.column())
+        return sort_keys[left.row()] < sort_keys[right.row()]
@@ -20,18 +20,24 @@ except ImportError:
 try:
     from ...ui.generated.review_browser_ui import Ui_BrowserWidget
     from ...services.data_service import DataService
-    from ..models.table_models import ReviewTableModel, ListTableModel
+    from ...services.thumbnail_loader import ThumbnailLoader
+    from ...services.project_loader import ProjectLoader
+    from ...services.refresh_poller import RefreshPoller
+    from ..models.table_models import ReviewTableModel, ListTableModel, VersionFilterProxyModel
     from ..controllers.advanced_filter_controller import AdvancedFilterController
     from ..controllers.lists_controller import ListsController
-    from ..managers.table_manager import TableManager
+    from ..managers.table_manager import TableManager, resize_columns_to_contents
     from ..managers.preferences_manager import PreferencesManager
 except ImportError:
     from ui.generated.review_browser_ui import Ui_BrowserWidget
     from services.data_service import DataService
-    from src.models.table_models import ReviewTableModel, ListTableModel
+    from services.thumbnail_loader import ThumbnailLoader
+    from services.project_loader import ProjectLoader
+    from services.refresh_poller import RefreshPoller
+    from src.models.table_models import ReviewTableModel, ListTableModel, VersionFilterProxyModel
     from src.controllers.advanced_filter_controller import AdvancedFilterController
     from src.controllers.lists_controller import ListsController
-    from src.managers.table_manager import TableManager
+    from src.managers.table_manager import TableManager, resize_columns_to_contents
     from src.managers.preferences_manager import PreferencesManager
 
 from ayon_activity_panel import ActivityPanel
@@ -50,12 +56,22 @@ class ReviewBrowser(QMainWindow, Ui_BrowserWidget):
 
         # Initialize core components
         self.data_service = DataService()
+        self.thumbnail_loader = ThumbnailLoader(self.data_service.api.get_version_thumbnail_data, parent=self)
+        self.project_loader = ProjectLoader(self.data_service, parent=self)
+        self.project_loader.progress.connect(self._on_project_load_progress)
+        self.project_loader.rows_loaded.connect(self._on_project_rows_loaded)
+        self.project_loader.loaded.connect(self._on_project_loaded)
+        self.project_loader.refreshed.connect(self._on_project_refreshed)
+        self.project_loader.failed.connect(self._on_project_load_failed)
+        self.refresh_poller = RefreshPoller(self.data_service, parent=self)
+        self.refresh_poller.updates_available.connect(self._on_project_updates_available)
 
         # Data storage
         self.all_versions = []
         self.current_versions = []
         self.playlists = {}
         self._current_version_id = None
+        self._show_partial_rows = False
 
         # Initialize managers
         self.table_manager = TableManager(self)
@@ -79,38 +95,49 @@ class ReviewBrowser(QMainWindow, Ui_BrowserWidget):
         self.list_model = ListTableModel()
         self.playlist_model = QStringListModel()
 
+        # Filtering and sorting happen in proxies, source models keep all rows
+        self.review_proxy = VersionFilterProxyModel(self)
+        self.review_proxy.setSourceModel(self.review_model)
+        self.list_proxy = VersionFilterProxyModel(self)
+        self.list_proxy.setSourceModel(self.list_model)
+
         # Set models to views
-        self.tableView_review_versions.setModel(self.review_model)
-        self.tableView_list_versions.setModel(self.list_model)
+        self.tableView_review_versions.setModel(self.review_proxy)
+        self.tableView_list_versions.setModel(self.list_proxy)
         self.listView.setModel(self.playlist_model)
 
         # Set table view references for dynamic thumbnail sizing
         self.review_model.set_table_view(self.tableView_review_versions)
         self.list_model.set_table_view(self.tableView_list_versions)
 
+        # Thumbnails are fetched in the background for rows as they get painted
+        self.review_model.set_thumbnail_loader(self.thumbnail_loader)
+        self.list_model.set_thumbnail_loader(self.thumbnail_loader)
+
         # Configure tables through manager
         self.table_manager.setup_tables()
         self.table_manager.setup_context_menus()
 
         # Connect signals
-        self.review_model.sorting_started.connect(self._clear_selection)
-        self.list_model.sorting_started.connect(self._clear_selection)
+        self.review_proxy.sorting_started.connect(self._clear_selection)
+        self.list_proxy.sorting_started.connect(self._clear_selection)
 
         # Connect table double-click to activity panel
         self.tableView_review_versions.doubleClicked.connect(self._on_row_double_clicked)
         self.tableView_list_versions.doubleClicked.connect(self._on_row_double_clicked)
 
-        # Initialize persistent editors
-        self.table_manager.open_persistent_editors()
-
     def _setup_controllers(self):
         """Initialize and configure controllers."""
         self.filter_controller = AdvancedFilterController(self.filtersLayout, self.toolButton)
         self.lists_controller = ListsController(self)
 
+        self.review_proxy.set_strategy(self.filter_controller.review_filter_controller.strategy)
+        self.list_proxy.set_strategy(self.filter_controller.list_filter_controller.strategy)
+
         # Connect filter signals
         self.filter_controller.filters_changed.connect(self._on_filters_changed)
         self.filter_controller.project_changed.connect(self.on_project_changed)
+        self.filter_controller.refresh_requested.connect(self.on_refresh_requested)
 
         # Connect UI signals
         self.tabWidget.currentChanged.connect(self.on_tab_changed)
@@ -131,23 +158,114 @@ class ReviewBrowser(QMainWindow, Ui_BrowserWidget):
 
     def on_project_changed(self, project_name):
         """Handle project selection change."""
+        self.thumbnail_loader.set_project(project_name or None)
+        self.review_model.clear_thumbnails()
+        self.list_model.clear_thumbnails()
+
         if project_name:
             self.activity_panel.set_project(project_name)
             self._load_project_data(project_name)
         else:
+            self.project_loader.cancel()
+            self.refresh_poller.set_project(None)
             self._clear_project_data()
-
-        self._update_ui_after_project_change(project_name)
+            self._update_ui_after_project_change(project_name)
 
         # Save project selection to QSettings
         settings = QSettings("ReviewBrowser1", "UIPreferences1")
         settings.setValue("current_project", project_name or "")
 
+    def on_refresh_requested(self, project_name):
+        """Fetch only what changed since the last load, or reload the project."""
+        if project_name and project_name == self.data_service.current_project and self.project_loader.is_loading():
+            # The running load brings fresh data anyway, don't cancel it
+            self.statusBar().showMessage(f"{project_name}: still loading, refresh skipped", 5000)
+            return
+        if (not project_name or project_name != self.data_service.current_project
+                or not self.data_service.has_sync_mark(project_name)):
+            self.on_project_changed(project_name)
+            return
+        self.project_loader.refresh(project_name, (row.get('version_id') for row in self.all_versions))
+
     def _load_project_data(self, project_name):
-        """Load data for selected project."""
+        """Start loading data for selected project in the background."""
+        if project_name != self.data_service.current_project:
+            # Don't show rows of the previous project while the new one loads
+            self._clear_project_data()
+            snapshot = self.data_service.load_snapshot(project_name)
+            if snapshot:
+                # Show the rows saved by the last load, the load below reconciles them
+                self._apply_snapshot(project_name, snapshot)
+            else:
+                self._update_ui_after_project_change(None)
+
         self.data_service.set_project(project_name)
-        self.all_versions = self.data_service.fetch_versions()
-        self.playlists = self.data_service.fetch_playlists()
+        # Don't poll for updates until the project has been loaded
+        self.refresh_poller.set_project(None)
+        # Rows are shown page by page only when the table starts out empty,
+        # a reload of the current project replaces the rows once it finishes
+        self._show_partial_rows = not self.all_versions
+        self.project_loader.load(project_name)
+
+    def _apply_snapshot(self, project_name, snapshot):
+        """Show locally saved project data until the server load finishes."""
+        self.all_versions = snapshot["versions"]
+        self.playlists = snapshot["playlists"]
+        self._update_ui_after_project_change(project_name, snapshot["statuses"], snapshot["task_types"])
+        saved_at = QDateTime.fromSecsSinceEpoch(int(snapshot["saved_at"])).toString("yyyy-MM-dd hh:mm")
+        self.statusBar().showMessage(f"{project_name}: showing data saved {saved_at}, refreshing...")
+
+    def _on_project_load_progress(self, project_name, message, percent):
+        """Show project load progress in the status bar."""
+        if percent >= 0:
+            message = f"{message} ({percent}%)"
+        self.statusBar().showMessage(f"{project_name}: {message}")
+
+    def _on_project_rows_loaded(self, project_name, rows):
+        """Show review rows while the rest of the project is still loading."""
+        if project_name != self.data_service.current_project or not self._show_partial_rows:
+            return
+        self.all_versions.extend(rows)
+        self.review_model.append_rows(rows)
+
+    def _on_project_loaded(self, project_name, result):
+        """Apply project data delivered by the background loader."""
+        self.all_versions = result["versions"]
+        self.playlists = result["playlists"]
+        self._update_ui_after_project_change(project_name, result["statuses"], result["task_types"])
+        self.statusBar().showMessage(f"{project_name}: loaded {len(self.all_versions)} submissions", 5000)
+
+        self.refresh_poller.set_interval(result["auto_refresh_interval"])
+        self.refresh_poller.set_project(project_name)
+
+    def _on_project_updates_available(self, project_name):
+        """Merge changes found by the auto-refresh poller, unless a load is running."""
+        if project_name == self.data_service.current_project and not self.project_loader.is_loading():
+            self.on_refresh_requested(project_name)
+
+    def _on_project_refreshed(self, project_name, result):
+        """Merge changes delivered by an incremental refresh into the loaded rows."""
+        if project_name != self.data_service.current_project:
+            return
+        self.all_versions = self.data_service.merge_version_updates(self.all_versions, result)
+        self.review_model.update_data(self.all_versions)
+        self.data_service.save_snapshot(project_name, self.all_versions, result)
+        self.filter_controller.set_reviewers(self._extract_reviewers())
+
+        self.playlists = result["playlists"]
+        playlists_names = list(self.playlists.keys())
+        if playlists_names != self.playlist_model.stringList():
+            self.playlist_model.setStringList(playlists_names)
+            self.lists_controller.update_list_items(playlists_names)
+
+        self.apply_filters()
+        updated_count = len(result["rows"]) + len(result["versions"])
+        self.statusBar().showMessage(f"{project_name}: {updated_count} submissions updated", 5000)
+
+    def _on_project_load_failed(self, project_name, error):
+        """Report a failed project load."""
+        print(f"Error loading project '{project_name}': {error}")
+        self.statusBar().showMessage(f"{project_name}: failed to load project data")
 
     def _clear_project_data(self):
         """Clear project data when no project selected."""
@@ -155,7 +273,7 @@ class ReviewBrowser(QMainWindow, Ui_BrowserWidget):
         self.all_versions = []
         self.playlists = {}
 
-    def _update_ui_after_project_change(self, project_name):
+    def _update_ui_after_project_change(self, project_name, statuses=None, task_types=None):
         """Update UI components after project change."""
         reviewers = self._extract_reviewers() if project_name else []
         playlists_names = list(self.playlists.keys()) if project_name else []
@@ -167,11 +285,8 @@ class ReviewBrowser(QMainWindow, Ui_BrowserWidget):
 
         self.filter_controller.set_reviewers(reviewers)
 
-        # Fetch and set dynamic statuses and task types
-        if project_name:
-            statuses = self.data_service.fetch_version_statuses(project_name)
-            task_types = self.data_service.fetch_task_types(project_name)
-
+        # Set dynamic statuses and task types
+        if project_name and statuses is not None and task_types is not None:
             self.filter_controller.review_filter_controller.strategy.set_status_items(statuses)
             self.filter_controller.list_filter_controller.strategy.set_status_items(statuses)
             self.filter_controller.review_filter_controller.strategy.set_task_type_items(task_types)
@@ -183,10 +298,11 @@ class ReviewBrowser(QMainWindow, Ui_BrowserWidget):
             self.filter_controller.filter_manager.refresh_current_strategy()
 
         self.current_versions = []
+        self.list_model.update_data(self.current_versions)
         self.apply_filters()
 
         if project_name:
-            self.tableView_review_versions.resizeColumnsToContents()
+            resize_columns_to_contents(self.tableView_review_versions)
 
     def _extract_reviewers(self):
         """Extract unique reviewers from versions data."""
@@ -200,6 +316,7 @@ class ReviewBrowser(QMainWindow, Ui_BrowserWidget):
             current_project = self.filter_controller.get_current_project()
             playlist_id = self.playlists[playlist_name]
             self.current_versions = self.data_service.fetch_versions_by_playlist(playlist_id, current_project)
+            self.list_model.update_data(self.current_versions)
             self.apply_filters()
 
     def on_tab_changed(self):
@@ -207,7 +324,6 @@ class ReviewBrowser(QMainWindow, Ui_BrowserWidget):
         current_tab = self.tabWidget.currentIndex()
         self.filter_controller.switch_tab(current_tab)
         QTimer.singleShot(100, self.apply_filters)
-        QTimer.singleShot(150, self.table_manager.open_persistent_editors)
 
     def _on_filters_changed(self, tab_index, filters):
         """Handle filter changes from filter controller."""
@@ -216,17 +332,14 @@ class ReviewBrowser(QMainWindow, Ui_BrowserWidget):
     def apply_filters(self):
         """Apply current filters to data."""
         current_tab = self.tabWidget.currentIndex()
+        filters = self.filter_controller.get_filter_values()
 
         if current_tab == 0:  # Review tab
-            filtered_versions = self.filter_controller.apply_filters(self.all_versions, current_tab)
-            self.review_model.update_data(filtered_versions)
-            self.tableView_review_versions.resizeColumnsToContents()
+            self.review_proxy.set_filters(filters)
+            resize_columns_to_contents(self.tableView_review_versions)
         else:  # Lists tab
-            filtered_versions = self.filter_controller.apply_filters(self.current_versions, current_tab)
-            self.list_model.update_data(filtered_versions)
-            self.tableView_list_versions.resizeColumnsToContents()
-
-        QTimer.singleShot(50, self.table_manager.open_persistent_editors)
+            self.list_proxy.set_filters(filters)
+            resize_columns_to_contents(self.tableView_list_versions)
 
     def _on_row_double_clicked(self, index):
         """Update activity panel when row is double-clicked."""
@@ -235,15 +348,27 @@ class ReviewBrowser(QMainWindow, Ui_BrowserWidget):
         
         current_tab = self.tabWidget.currentIndex()
         table_view = self.tableView_review_versions if current_tab == 0 else self.tableView_list_versions
-        model = table_view.model()
-        row_data = model._data[index.row()]
+        row_data = table_view.model().row_data(index)
         
         # Skip if same version (prevents redundant work)
         if row_data['version_id'] == self._current_version_id:
             return
         
         self._current_version_id = row_data['version_id']
-        self.activity_panel.set_version(row_data['version_id'], row_data)
+        self.activity_panel.set_version(row_data['version_id'], row_data.to_dict())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh_poller.set_throttled(self.isMinimized())
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_poller.set_throttled(True)
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self.refresh_poller.set_throttled(self.isMinimized() or not self.isVisible())
 
     def _clear_selection(self):
         """Clear selection when sorting."""
@@ -255,7 +380,3 @@ class ReviewBrowser(QMainWindow, Ui_BrowserWidget):
         window = self.frameGeometry()
         window.moveCenter(screen.center())
         self.move(window.topLeft())
-
-    def open_persistent_editors(self):
-        """Delegate to table manager."""
-        self.table_manager.open_persistent_editors()
@@ -47,32 +47,41 @@ def parse_date_simple(date_str):
         return None
 
 
-def filter_by_date_simple(items, date_filter="ALL"):
-    """Filter items by date range using simple date parsing"""
-    if date_filter == "ALL":
-        return items
-
+def get_date_range(date_filter):
+    """Return (start, end) datetimes for a date filter, or None if it does not restrict dates"""
     now = datetime.now()
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
     if date_filter == "Today":
-        start_date = today_start
-        end_date = today_start + timedelta(days=1)
+        return today_start, today_start + timedelta(days=1)
     elif date_filter == "Yesterday":
-        start_date = today_start - timedelta(days=1)
-        end_date = today_start
+        return today_start - timedelta(days=1), today_start
     elif date_filter == "Last 7 days":
-        start_date = today_start - timedelta(days=7)
-        end_date = today_start + timedelta(days=1)
-    else:
+        return today_start - timedelta(days=7), today_start + timedelta(days=1)
+    return None
+
+
+def matches_date_range(item, date_range):
+    """Check whether an item's submitted/created date falls into a date range"""
+    if date_range is None:
+        return True
+
+    start_date, end_date = date_range
+    date_field = item.get("submitted_at") or item.get("created_at")
+    if date_field and date_field != "N/A":
+        item_date = parse_date_simple(date_field)
+        if item_date and start_date <= item_date < end_date:
+            return True
+    return False
+
+
+def filter_by_date_simple(items, date_filter="ALL"):
+    """Filter items by date range using simple date parsing"""
+    if date_filter == "ALL":
         return items
 
-    filtered_items = []
-    for item in items:
-        date_field = item.get("submitted_at") or item.get("created_at")
-        if date_field and date_field != "N/A":
-            item_date = parse_date_simple(date_field)
-            if item_date and start_date <= item_date < end_date:
-                filtered_items.append(item)
+    date_range = get_date_range(date_filter)
+    if date_range is None:
+        return items
 
-    return filtered_items
\ No newline at end of file
+    return [item for item in items if matches_date_range(item, date_range)]
@@ -0,0 +1,148 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from typing import Optional
+
+
+class DiskCache:
+    """Size-capped file cache with least-recently-used eviction.
+
+    Entries are keyed by ``(project_name, item_id)`` and stored under a hash
+    of that key. Reads refresh the file modification time, which is what the
+    eviction order is based on, so the cache can be shared between several
+    processes without any index file.
+    """
+
+    def __init__(self, root_dir: str, max_bytes: int, suffix: str = ""):
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    def get_path(self, project_name: str, item_id: str, suffix: Optional[str] = None) -> Optional[str]:
+        """Return path of a cached entry, or None when it is not cached.
+
+        `suffix` overrides the cache's file suffix, e.g. to keep the file
+        extension of cached media.
+        """
+        path = self._entry_path(project_name, item_id, suffix)
+        try:
+            os.utime(path, None)
+        except OSError:
+            return None
+        return path
+
+    def get(self, project_name: str, item_id: str) -> Optional[bytes]:
+        """Return cached bytes, or None when the entry is not cached."""
+        path = self.get_path(project_name, item_id)
+        if not path:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, project_name: str, item_id: str, data: bytes) -> Optional[str]:
+        """Atomically store bytes and return the path of the cached entry."""
+        path = self._entry_path(project_name, item_id)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Error writing cache entry {path}: {e}")
+            return None
+
+        self._add_size(len(data), path)
+        return path
+
+    def get_partial_path(self, project_name: str, item_id: str, suffix: Optional[str] = None) -> str:
+        """Return path where an entry can be written incrementally before `commit_file`.
+
+        The partial file lives next to the entry, so committing it is an
+        atomic rename. It counts towards the quota and is evicted like any
+        entry when left behind.
+        """
+        path = self._entry_path(project_name, item_id, suffix) + ".part"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    def commit_file(self, project_name: str, item_id: str, file_path: str,
+                    suffix: Optional[str] = None) -> Optional[str]:
+        """Atomically move a complete file into the cache and return its cached path.
+
+        A file bigger than the whole quota is not cached, it is moved to the
+        system temp directory instead and that path is returned.
+        """
+        path = self._entry_path(project_name, item_id, suffix)
+        try:
+            size = os.path.getsize(file_path)
+            if size > self.max_bytes:
+                uncached_path = os.path.join(tempfile.gettempdir(), os.path.basename(path))
+                shutil.move(file_path, uncached_path)
+                return uncached_path
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(file_path, path)
+        except OSError as e:
+            print(f"Error writing cache entry {path}: {e}")
+            return None
+
+        self._add_size(size, path)
+        return path
+
+    def _entry_path(self, project_name: str, item_id: str, suffix: Optional[str] = None) -> str:
+        digest = hashlib.sha1(f"{project_name}\0{item_id}".encode("utf-8")).hexdigest()
+        return os.path.join(self.root_dir, digest[:2], digest + (self.suffix if suffix is None else suffix))
+
+    def _iter_entries(self):
+        for dir_path, _, file_names in os.walk(self.root_dir):
+            for file_name in file_names:
+                if file_name.endswith(".tmp"):
+                    continue
+                path = os.path.join(dir_path, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _add_size(self, size: int, added_path: str):
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(entry[1] for entry in self._iter_entries())
+            else:
+                self._total_bytes += size
+
+            if self._total_bytes > self.max_bytes:
+                self._evict(added_path)
+
+    def _evict(self, keep_path: str):
+        """Remove least recently used entries until the cache fits its quota.
+
+        `keep_path`, the entry just added, is never removed since its path
+        is returned to the caller.
+        """
+        entries = sorted(self._iter_entries(), key=lambda entry: entry[2])
+        total_bytes = sum(entry[1] for entry in entries)
+        # Leave some headroom so a burst of writes does not evict on every put
+        target_bytes = self.max_bytes * 0.9
+
+        for path, size, _ in entries:
+            if total_bytes <= target_bytes:
+                break
+            if path == keep_path:
+                continue
+            try:
+                os.remove(path)
+                total_bytes -= size
+            except OSError:
+                continue
+
+        self._total_bytes = total_bytes
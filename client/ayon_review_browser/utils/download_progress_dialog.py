@@ -7,6 +7,9 @@ except ImportError:
     from PySide2.QtGui import *
     from PySide2.QtWidgets import *
 
+# Progress bar steps per file
+PROGRESS_STEPS_PER_FILE = 1000
+
 
 class DownloadProgressDialog(QDialog):
     """Dialog to show download progress for reviewables."""
@@ -27,9 +30,9 @@ class DownloadProgressDialog(QDialog):
         self.file_label = QLabel("Preparing download...")
         layout.addWidget(self.file_label)
 
-        # Progress bar
+        # Progress bar, in per mille of a file so byte progress moves it smoothly
         self.progress_bar = QProgressBar()
-        self.progress_bar.setMaximum(self.total_files)
+        self.progress_bar.setMaximum(self.total_files * PROGRESS_STEPS_PER_FILE)
         self.progress_bar.setValue(0)
         layout.addWidget(self.progress_bar)
 
@@ -37,16 +40,75 @@ class DownloadProgressDialog(QDialog):
         self.status_label = QLabel(f"0 / {self.total_files} files downloaded")
         layout.addWidget(self.status_label)
 
-    def update_progress(self, filename, current, total):
-        """Update progress for current file download."""
+        # Cancel button, only shown while tracking a download manager
+        self.button_box = QDialogButtonBox(QDialogButtonBox.Cancel)
+        self.button_box.rejected.connect(self.reject)
+        self.button_box.setVisible(False)
+        layout.addWidget(self.button_box)
+
+    def track_downloads(self, download_manager):
+        """Show aggregate progress of a DownloadManager, cancelling it when the dialog is cancelled."""
+        download_manager.progress.connect(self.update_total_progress)
+        download_manager.finished.connect(self._on_downloads_finished)
+        self.rejected.connect(download_manager.cancel)
+        self.button_box.setVisible(True)
+
+    def update_total_progress(self, filename, finished, total, bytes_done, bytes_total):
+        """Update progress from aggregate byte counts of concurrent downloads."""
+        self.current_file = finished
+        if bytes_total:
+            value = bytes_done * self.progress_bar.maximum() // bytes_total
+            size_text = f"{_format_size(bytes_done)} of {_format_size(bytes_total)}"
+        else:
+            value = finished * PROGRESS_STEPS_PER_FILE
+            size_text = _format_size(bytes_done or 0)
+
+        self.file_label.setText(f"Downloading: {filename}")
+        self.progress_bar.setValue(min(value, self.progress_bar.maximum()))
+        self.status_label.setText(f"{finished} / {total} files downloaded ({size_text})")
+
+    def _on_downloads_finished(self, results):
+        failed_count = sum(1 for path in results.values() if not path)
+        self.button_box.setStandardButtons(QDialogButtonBox.Close)
+        if not failed_count:
+            self.set_complete()
+            return
+        self.file_label.setText("Download finished with errors")
+        self.status_label.setText(f"{failed_count} of {len(results)} files failed or were cancelled")
+
+    def update_progress(self, filename, current, total, bytes_done=None, bytes_total=None):
+        """Update progress for current file download.
+
+        `current` is the number of files already downloaded. `bytes_done` and
+        `bytes_total` report progress within the file being downloaded and
+        may be sent for every chunk.
+        """
         self.current_file = current
+        value = current * PROGRESS_STEPS_PER_FILE
+        status = f"{current} / {total} files downloaded"
+        if bytes_done is not None:
+            if bytes_total:
+                value += min(PROGRESS_STEPS_PER_FILE, bytes_done * PROGRESS_STEPS_PER_FILE // bytes_total)
+                status += f" ({_format_size(bytes_done)} of {_format_size(bytes_total)})"
+            else:
+                status += f" ({_format_size(bytes_done)})"
+
         self.file_label.setText(f"Downloading: {filename}")
-        self.progress_bar.setValue(current)
-        self.status_label.setText(f"{current} / {total} files downloaded")
+        self.progress_bar.setValue(value)
+        self.status_label.setText(status)
         QApplication.processEvents()
 
     def set_complete(self):
         """Mark download as complete."""
         self.file_label.setText("Download complete!")
+        self.progress_bar.setValue(self.progress_bar.maximum())
         self.status_label.setText(f"All {self.total_files} files downloaded successfully")
         QApplication.processEvents()
+
+
+def _format_size(size):
+    """Format a byte count for display, e.g. 1.5 GB."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024.0
@@ -0,0 +1,39 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket shared by several threads, limiting total bytes per second.
+
+    Transfers may take more bytes than the bucket holds; the bucket then
+    goes into debt and the caller sleeps until the debt is paid back, so
+    chunks bigger than one second of bandwidth still get through.
+    """
+
+    def __init__(self, max_bytes_per_second):
+        self.max_bytes_per_second = float(max_bytes_per_second)
+        self._lock = threading.Lock()
+        self._allowance = self.max_bytes_per_second
+        self._last_time = time.monotonic()
+
+    def consume(self, byte_count, cancel_event=None):
+        """Account for `byte_count` transferred bytes, sleeping as long as the limit requires.
+
+        Returns False when `cancel_event` was set while waiting, True otherwise.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(
+                self.max_bytes_per_second,
+                self._allowance + (now - self._last_time) * self.max_bytes_per_second
+            )
+            self._last_time = now
+            self._allowance -= byte_count
+            wait = -self._allowance / self.max_bytes_per_second if self._allowance < 0 else 0
+
+        if wait <= 0:
+            return True
+        if cancel_event is None:
+            time.sleep(wait)
+            return True
+        return not cancel_event.wait(wait)
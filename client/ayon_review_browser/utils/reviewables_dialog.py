@@ -72,3 +72,17 @@ def show_reviewables_dialog(all_versions_data, parent=None):
     """Show reviewables dialog and return True if user accepts."""
     dialog = ReviewablesDialog(all_versions_data, parent)
     return dialog.exec_() == QDialog.Accepted if hasattr(QDialog, 'Accepted') else dialog.exec() == QDialog.Accepted
+
+
+def show_rows_reviewables_dialog(data_service, project_name, rows, parent=None):
+    """Show reviewables of many table rows, e.g. a whole playlist.
+
+    Reviewables are looked up through `DataService.get_rows_reviewables`,
+    concurrently and only for versions not looked up since the last load.
+    """
+    reviewables = data_service.get_rows_reviewables(project_name, rows)
+    all_versions_data = [
+        {'row_data': row_data, 'reviewables': row_reviewables}
+        for row_data, row_reviewables in zip(rows, reviewables)
+    ]
+    return show_reviewables_dialog(all_versions_data, parent)
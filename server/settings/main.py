@@ -34,7 +34,7 @@ class UISettings(BaseSettingsModel):
     )
     auto_refresh_interval: int = SettingsField(
         0,
-        title="Auto-refresh Interval (seconds, 0=disabled)",
+        title="Auto-refresh Interval (seconds, 0=disabled, at least 15)",
         ge=0
     )
     show_version_thumbnails: bool = SettingsField(
@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "client", "ayon_review_browser"))
+
+pytest.importorskip("ayon_api")
+# The services package also pulls in the Qt based services
+try:
+    import qtpy  # noqa: F401
+except ImportError:
+    pytest.importorskip("PySide2")
+
+from services.data_service import DataService
+from services.version_row import VersionRow
+
+
+def _row(task_id, submitted_at):
+    return VersionRow(task_id=task_id, version_id=f"version-{task_id}", submitted_at=submitted_at)
+
+
+def test_merge_moves_resubmitted_task_to_the_top():
+    service = DataService.__new__(DataService)
+    rows = [_row("b", "2025-05-02"), _row("a", "2025-05-01"), _row("c", "2025-04-30")]
+    updates = {"rows": [_row("c", "2025-05-04")], "versions": {}}
+
+    merged = service.merge_version_updates(rows, updates)
+
+    assert [(row["task_id"], row["submitted_at"]) for row in merged] == [
+        ("c", "2025-05-04"), ("b", "2025-05-02"), ("a", "2025-05-01")
+    ]
+
+
+def test_merge_adds_new_submissions_in_order():
+    service = DataService.__new__(DataService)
+    rows = [_row("b", "2025-05-02"), _row("a", "2025-05-01")]
+    updates = {"rows": [_row("d", "2025-05-03")], "versions": {}}
+
+    merged = service.merge_version_updates(rows, updates)
+
+    assert [row["task_id"] for row in merged] == ["d", "b", "a"]
@@ -0,0 +1,40 @@
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "client", "ayon_review_browser"))
+
+from utils.disk_cache import DiskCache
+
+
+def _write_part(cache, item_id, size):
+    part_path = cache.get_partial_path("project", item_id, ".mov")
+    with open(part_path, "wb") as f:
+        f.write(b"x" * size)
+    return part_path
+
+
+def test_commit_keeps_file_filling_most_of_the_quota(tmp_path):
+    cache = DiskCache(str(tmp_path / "media"), 1000)
+    old_path = cache.commit_file("project", "old", _write_part(cache, "old", 300), ".mov")
+    os.utime(old_path, (1, 1))
+
+    path = cache.commit_file("project", "new", _write_part(cache, "new", 950), ".mov")
+
+    assert os.path.getsize(path) == 950
+    assert cache.get_path("project", "new", ".mov") == path
+    assert not os.path.exists(old_path)
+
+
+def test_commit_skips_caching_file_bigger_than_the_quota(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    cache = DiskCache(str(tmp_path / "media"), 1000)
+    kept_path = cache.commit_file("project", "kept", _write_part(cache, "kept", 400), ".mov")
+
+    path = cache.commit_file("project", "huge", _write_part(cache, "huge", 1500), ".mov")
+
+    assert os.path.getsize(path) == 1500
+    assert os.path.dirname(path) == str(tmp_path)
+    assert path.endswith(".mov")
+    assert cache.get_path("project", "huge", ".mov") is None
+    assert os.path.exists(kept_path)
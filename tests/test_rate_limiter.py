@@ -0,0 +1,68 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "client", "ayon_review_browser"))
+
+from utils import rate_limiter
+from utils.rate_limiter import RateLimiter
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class FakeTime:
+    """Clock that only moves when slept on."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeEvent:
+    def __init__(self, fake_time, cancelled=False):
+        self.fake_time = fake_time
+        self.cancelled = cancelled
+
+    def wait(self, timeout):
+        self.fake_time.sleep(timeout)
+        return self.cancelled
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    return fake
+
+
+def test_consume_within_allowance_does_not_wait(fake_time):
+    limiter = RateLimiter(CHUNK_SIZE)
+    assert limiter.consume(CHUNK_SIZE // 2)
+    assert fake_time.sleeps == []
+
+
+def test_chunk_above_cap_goes_into_debt_and_waits(fake_time):
+    limiter = RateLimiter(CHUNK_SIZE // 2)
+    assert limiter.consume(CHUNK_SIZE)
+    assert limiter.consume(CHUNK_SIZE)
+    # The full bucket covers half of the first chunk, the rest is paid back at 512 KiB/s
+    assert fake_time.sleeps == [pytest.approx(1.0), pytest.approx(2.0)]
+
+
+def test_debt_wait_uses_cancel_event(fake_time):
+    limiter = RateLimiter(CHUNK_SIZE // 2)
+    assert limiter.consume(CHUNK_SIZE, FakeEvent(fake_time))
+    assert fake_time.sleeps == [pytest.approx(1.0)]
+
+
+def test_cancel_while_waiting_returns_false(fake_time):
+    limiter = RateLimiter(1024)
+    assert not limiter.consume(CHUNK_SIZE, FakeEvent(fake_time, cancelled=True))